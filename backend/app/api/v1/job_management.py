@@ -18,6 +18,7 @@ from pydantic import BaseModel, ConfigDict
 from app.db.database import get_db
 from app.db.models import Job, Result, User, JobStatus, UserRole
 from app.services.auth_service import get_current_user, TokenData, require_role
+from app.services.progress_service import job_progress
 
 router = APIRouter()
 
@@ -199,7 +200,7 @@ async def list_jobs(
         items.append(JobListItem(
             id=job.id,
             status=job.status.value,
-            progress=job.progress,
+            progress=job_progress(job)["progress"],
             experiment_type=job.experiment_type,
             method=job.method,
             quality_grade=quality_grade,
@@ -249,7 +250,7 @@ async def list_my_jobs(
         items.append(JobListItem(
             id=job.id,
             status=job.status.value,
-            progress=job.progress,
+            progress=job_progress(job)["progress"],
             experiment_type=job.experiment_type,
             method=job.method,
             quality_grade=quality_grade,
@@ -301,7 +302,7 @@ async def list_organization_jobs(
         items.append(JobListItem(
             id=job.id,
             status=job.status.value,
-            progress=job.progress,
+            progress=job_progress(job)["progress"],
             experiment_type=job.experiment_type,
             method=job.method,
             quality_grade=quality_grade,
@@ -365,17 +366,18 @@ async def get_job_detail(
             "report_pdf_path": job.result.report_pdf_path,
         }
 
+    live = job_progress(job)
     return JobDetailResponse(
         id=job.id,
         status=job.status.value,
-        progress=job.progress,
+        progress=live["progress"],
         sequence=job.sequence,
         experiment_type=job.experiment_type,
         method=job.method,
         ethics_config=job.ethics_config or {},
         prediction_config=job.prediction_config or {},
-        current_stage=job.current_stage,
-        stage_index=job.stage_index,
+        current_stage=live["stage"],
+        stage_index=live["stage_index"],
         estimated_time_seconds=job.estimated_time_seconds,
         processing_time_seconds=job.processing_time_seconds,
         created_at=job.created_at,
@@ -497,10 +499,11 @@ async def delete_job(
         logging.error(f"Failed to delete files for job {job_id}: {e}")
 
     # Delete database records (cascade will handle related records)
-    from app.db.models import FileStorage, AuditLog, Result
+    from app.db.models import FileStorage, AuditLog, Checkpoint, Result
 
     db.query(FileStorage).filter(FileStorage.job_id == job_id).delete()
     db.query(AuditLog).filter(AuditLog.job_id == job_id).delete()
+    db.query(Checkpoint).filter(Checkpoint.job_id == job_id).delete()
     db.query(Result).filter(Result.job_id == job_id).delete()
     db.delete(job)
     db.commit()
@@ -601,7 +604,7 @@ async def advanced_search(
         items.append(JobListItem(
             id=job.id,
             status=job.status.value,
-            progress=job.progress,
+            progress=job_progress(job)["progress"],
             experiment_type=job.experiment_type,
             method=job.method,
             quality_grade=quality_grade,
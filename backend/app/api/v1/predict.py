@@ -19,6 +19,7 @@ from app.services.science_service import ScienceService
 from app.instrumentation import metrics
 from app.db.database import SessionLocal
 from app.db.models import Job, Result, calculate_job_expiration, Organization
+from app.services.progress_service import job_progress
 from app.tasks.prediction_tasks import run_structure_prediction
 
 logger = logging.getLogger(__name__)
@@ -346,12 +347,14 @@ async def get_job_status(
                 "policy_compliance": result.policy_compliance,
             }
 
+        live = job_progress(job)
+
         return JobStatusResponse(
             job_id=job_id,
             status=job.status.value if hasattr(job.status, "value") else job.status,
-            progress=job.progress or 0.0,
-            current_stage=job.current_stage,
-            stage_index=job.stage_index,
+            progress=live["progress"],
+            current_stage=live["stage"],
+            stage_index=live["stage_index"],
             total_stages=job.total_stages or 8,
             metrics=metrics_payload or None,
             ethics_status=ethics_payload or None,
@@ -7,7 +7,7 @@ Background task queue for long-running predictions.
 
 import os
 from celery import Celery
-from celery.signals import task_prerun, task_postrun, task_failure
+from celery.signals import task_prerun, task_postrun, task_failure, worker_process_init
 
 # Broker / backend configuration (override via env for local smoke)
 BROKER_URL = os.getenv("BROKER_URL", os.getenv("REDIS_URL", "redis://localhost:6379/0"))
@@ -73,6 +73,14 @@ if os.getenv("CELERY_TASK_ALWAYS_EAGER", "").lower() in {"1", "true", "yes"}:
 # Task Signals
 # ============================================================================
 
+@worker_process_init.connect
+def worker_process_init_handler(**kwargs):
+    """Warm per-process services so the first task does not pay their setup cost."""
+    from app.tasks.prediction_tasks import _get_science_service
+
+    _get_science_service()
+
+
 @task_prerun.connect
 def task_prerun_handler(task_id, task, *args, **kwargs):
     """Log when task starts."""
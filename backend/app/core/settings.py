@@ -29,6 +29,7 @@ class Settings:
     _redis_parsed = urlparse(REDIS_URL)
     REDIS_HOST = _redis_parsed.hostname or "localhost"
     REDIS_PORT = _redis_parsed.port or 6379
+    PROGRESS_BACKEND = os.getenv("PROGRESS_BACKEND", "db")  # "db" or "redis" (live stage progress)
 
     # MinIO
     MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT", "")
@@ -36,6 +37,8 @@ class Settings:
     MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY", "")
     MINIO_BUCKET = os.getenv("MINIO_BUCKET", "rexsyn-nexus")
     MINIO_SECURE = os.getenv("MINIO_SECURE", "false").lower() in {"1", "true", "yes"}
+    MINIO_PARALLEL_UPLOADS = int(os.getenv("MINIO_PARALLEL_UPLOADS", "8"))  # concurrent multipart parts
+    CHECKPOINT_STORE = os.getenv("CHECKPOINT_STORE", "db")  # "db" (inline JSON) or "minio" (compressed blobs)
 
     # MLflow
     MLFLOW_TRACKING_URI = os.getenv("MLFLOW_TRACKING_URI", "http://rsn-mlflow:5000")
@@ -45,6 +48,10 @@ class Settings:
     POSEBUSTERS_CMD = os.getenv("POSEBUSTERS_CMD", "")
     DOCKQ_CMD = os.getenv("DOCKQ_CMD", "")
     SAXS_CMD = os.getenv("SAXS_CMD", "")
+    SCIENCE_CACHE_DIR = os.getenv("SCIENCE_CACHE_DIR", "")  # empty disables the CLI result cache
+
+    # Model weights (used for reproducibility checksums; empty keeps placeholders)
+    MODEL_WEIGHTS_DIR = os.getenv("MODEL_WEIGHTS_DIR", "")
 
 
 settings = Settings()
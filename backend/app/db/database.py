@@ -5,12 +5,21 @@ Database Configuration - RExSyn Nexus Production
 PostgreSQL connection and SQLAlchemy setup.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Any, Generator
+import json
+import math
 import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    ORJSON_AVAILABLE = False
+
 # Database URL from environment
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
@@ -18,23 +27,97 @@ DATABASE_URL = os.getenv(
 )
 
 
+def _orjson_default(value: Any) -> Any:
+    """Accept what json.dumps does but orjson does not: float/int subclasses."""
+    if isinstance(value, float):
+        return float(value)
+    if isinstance(value, int):
+        return int(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite_or_null(value: Any) -> Any:
+    """Copy of a JSON value with NaN/Infinity replaced by None, as orjson writes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_null(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_null(item) for item in value]
+    return value
+
+
+def _json_serializer(value: Any) -> str:
+    """
+    Encode JSON columns (checkpoints, audit metrics) with orjson when available.
+
+    Non-finite floats are stored as null on both paths, so rows read the same
+    whichever encoder wrote them.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            value,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+    try:
+        return json.dumps(value, allow_nan=False)
+    except ValueError:
+        return json.dumps(_finite_or_null(value))
+
+
+def _json_deserializer(value: str | bytes) -> Any:
+    """Decode JSON columns; rows written by json.dumps may hold NaN/Infinity, which orjson rejects."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
+_json_engine_args = {
+    "json_serializer": _json_serializer,
+    "json_deserializer": _json_deserializer,
+}
+
+
 # Create SQLAlchemy engine
 if DATABASE_URL.startswith("sqlite"):
+    _in_memory = DATABASE_URL in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in DATABASE_URL
     engine = create_engine(
         DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        pool_pre_ping=True,
+        connect_args={"check_same_thread": False, "timeout": 5},
+        # In-memory databases exist per connection, so share a single one;
+        # file databases keep a pool of long-lived connections (hot page cache,
+        # pragmas applied once per connection)
+        poolclass=StaticPool if _in_memory else QueuePool,
+        **({} if _in_memory else {"pool_size": 8, "max_overflow": 16}),
+        **_json_engine_args,
         echo=False,
     )
 else:
     engine = create_engine(
         DATABASE_URL,
+        poolclass=QueuePool,
         pool_pre_ping=True,  # Verify connections before using
-        pool_size=10,
-        max_overflow=20,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "8")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "16")),
+        pool_recycle=3600,  # Drop connections before server-side idle timeouts
+        **_json_engine_args,
         echo=False,
     )
 
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets readers run alongside the writer; NORMAL sync is durable under WAL."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -69,3 +152,22 @@ def init_db():
     Call this on application startup.
     """
     Base.metadata.create_all(bind=engine)
+
+    # create_all only builds indexes together with new tables; add indexes
+    # introduced since an existing database was created (no migration tool)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    # Checkpoints now live in their own table; drop "checkpoint:<stage>" audit
+    # rows left by earlier versions (served by a partial index, a no-op once
+    # they are gone)
+    from app.db.models import AuditLog
+
+    with engine.begin() as conn:
+        conn.execute(
+            AuditLog.__table__.delete().where(
+                AuditLog.status == "checkpoint",
+                AuditLog.stage_name.like("checkpoint:%"),
+            )
+        )
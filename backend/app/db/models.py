@@ -6,10 +6,11 @@ SQLAlchemy ORM models for all entities.
 """
 
 from sqlalchemy import (
-    Column, String, Integer, Float, Boolean, DateTime, Text, JSON, ForeignKey, Enum
+    Column, String, Integer, Float, Boolean, DateTime, Text, JSON, ForeignKey, Enum, Index,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship, synonym
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from datetime import datetime, timedelta, timezone
 import enum
 from app.db.database import Base
@@ -113,6 +114,10 @@ class Job(Base):
     Prediction job - tracks the entire prediction workflow.
     """
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Expired-job cleanup filters on status and expires_at together
+        Index("ix_jobs_status_expires", "status", "expires_at"),
+    )
 
     id = Column(String(50), primary_key=True)  # e.g., "exp-2024-001"
 
@@ -165,6 +170,7 @@ class Job(Base):
     result = relationship("Result", back_populates="job", uselist=False)
     audit_logs = relationship("AuditLog", back_populates="job")
     files = relationship("FileStorage", back_populates="job")
+    checkpoints = relationship("Checkpoint", back_populates="job")
 
 
 Job.metadata = synonym("metadata_json")
@@ -225,6 +231,15 @@ class AuditLog(Base):
     SIDRCE audit trail - records every stage of the ethics pipeline.
     """
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Checkpoint rows written here before the checkpoints table existed;
+        # the partial index keeps finding the leftovers cheap
+        Index(
+            "ix_audit_logs_checkpoints", "job_id", "stage_name",
+            postgresql_where=text("status = 'checkpoint'"),
+            sqlite_where=text("status = 'checkpoint'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     job_id = Column(String(50), ForeignKey("jobs.id"), nullable=False, index=True)
@@ -259,6 +274,28 @@ class AuditLog(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
+class Checkpoint(Base):
+    """
+    Latest resumable state of a pipeline stage.
+
+    One row per (job, stage), overwritten in place when a stage re-runs.
+    """
+    __tablename__ = "checkpoints"
+    __table_args__ = (
+        UniqueConstraint("job_id", "stage_name", name="uq_checkpoints_job_stage"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String(50), ForeignKey("jobs.id"), nullable=False)
+    job = relationship("Job", back_populates="checkpoints")
+
+    stage_name = Column(String(100), nullable=False)
+    data = Column(JSON)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class FileStorage(Base):
     """
     File metadata for S3/MinIO storage.
@@ -23,7 +23,7 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, asc
 
-from app.db.models import Job, Result, FileStorage, AuditLog, JobStatus, Organization
+from app.db.models import Job, Result, FileStorage, AuditLog, Checkpoint, JobStatus, Organization
 from app.services.storage_service import delete_job_files
 
 
@@ -187,6 +187,9 @@ class JobService:
             audit_log_count = self.db.query(AuditLog).filter(
                 AuditLog.job_id == job.id
             ).delete()
+            checkpoint_count = self.db.query(Checkpoint).filter(
+                Checkpoint.job_id == job.id
+            ).delete()
             result_count = self.db.query(Result).filter(
                 Result.job_id == job.id
             ).delete()
@@ -196,7 +199,7 @@ class JobService:
             self.db.commit()
 
             deletion_summary["database_records_deleted"] = (
-                file_storage_count + audit_log_count + result_count + 1
+                file_storage_count + audit_log_count + checkpoint_count + result_count + 1
             )
         except Exception as e:
             self.db.rollback()
@@ -24,6 +24,7 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 
 from app.db.models import Job, JobStatus
+from app.services.progress_service import job_progress
 
 
 class StageTransitionError(Exception):
@@ -294,8 +295,9 @@ class JobStateManager:
             total_time = job.estimated_time_seconds
 
         # Calculate remaining time based on progress
-        if job.progress > 0:
-            remaining = int(total_time * (1.0 - job.progress))
+        progress = job_progress(job)["progress"]
+        if progress > 0:
+            remaining = int(total_time * (1.0 - progress))
         else:
             remaining = total_time
 
@@ -334,15 +336,16 @@ class JobStateManager:
         Returns:
             Dictionary with detailed progress information
         """
-        current_stage_info = JobStageDefinition.get_stage(job.stage_index)
+        live = job_progress(job)
+        current_stage_info = JobStageDefinition.get_stage(live["stage_index"])
 
         return {
             "job_id": job.id,
             "status": job.status.value,
-            "overall_progress": job.progress,
+            "overall_progress": live["progress"],
             "current_stage": {
-                "name": job.current_stage or "Unknown",
-                "index": job.stage_index,
+                "name": live["stage"] or "Unknown",
+                "index": live["stage_index"],
                 "total_stages": job.total_stages,
                 "definition": current_stage_info,
             },
@@ -0,0 +1,92 @@
+"""
+Live Job Progress - Redis-backed
+================================
+
+Per-stage progress is ephemeral: the UI polls it while a job runs, and only
+the terminal state needs to be durable. With PROGRESS_BACKEND=redis it is kept
+in one Redis hash per job instead of being written to the jobs table on every
+stage.
+"""
+
+from functools import lru_cache
+import logging
+from typing import Any, Dict, Optional
+
+from app.core.settings import settings
+from app.db.models import JobStatus
+
+try:  # pragma: no cover - optional
+    from redis import Redis  # type: ignore
+except Exception as e:  # pragma: no cover
+    Redis = None  # type: ignore
+    logging.getLogger(__name__).warning("Redis client unavailable: %s", e)
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_TTL_SECONDS = 24 * 3600
+
+
+@lru_cache(maxsize=1)
+def _get_redis():
+    """Shared Redis client, or None when progress is kept in the database."""
+    if settings.PROGRESS_BACKEND != "redis" or Redis is None:
+        return None
+    return Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+def _progress_key(job_id: str) -> str:
+    return f"job:{job_id}:progress"
+
+
+def publish_progress(job_id: str, stage: str, stage_index: int, progress: float) -> bool:
+    """
+    Record live progress for a running job.
+
+    Returns False when Redis is disabled or unreachable, in which case the
+    caller should fall back to updating the job row.
+    """
+    client = _get_redis()
+    if client is None:
+        return False
+    key = _progress_key(job_id)
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.hset(key, mapping={"stage": stage, "index": stage_index, "progress": progress})
+        pipe.expire(key, PROGRESS_TTL_SECONDS)
+        pipe.execute()
+    except Exception as e:
+        logger.warning("Failed to publish progress for job %s: %s", job_id, e)
+        return False
+    return True
+
+
+def read_progress(job_id: str) -> Optional[Dict[str, Any]]:
+    """Live progress for a job ({stage, stage_index, progress}), or None if not tracked."""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        data = client.hgetall(_progress_key(job_id))
+    except Exception as e:
+        logger.warning("Failed to read progress for job %s: %s", job_id, e)
+        return None
+    if not data:
+        return None
+    return {
+        "stage": data.get("stage"),
+        "stage_index": int(data.get("index", 0)),
+        "progress": float(data.get("progress", 0.0)),
+    }
+
+
+def job_progress(job) -> Dict[str, Any]:
+    """
+    Current {stage, stage_index, progress} for a job.
+
+    Running jobs prefer the live Redis entry; everything else (and running
+    jobs without one) reads the job row.
+    """
+    live = read_progress(job.id) if job.status == JobStatus.RUNNING else None
+    if live is not None:
+        return live
+    return {"stage": job.current_stage, "stage_index": job.stage_index, "progress": job.progress or 0.0}
@@ -12,7 +12,7 @@ This service generates comprehensive reproducibility reports including:
 - Software environment details
 - Hardware specifications
 - Random seeds and timestamps
-- Complete audit trail
+- Audit trail tail with a tamper-evident incremental hash
 
 Format options:
 - JSON (machine-readable)
@@ -21,24 +21,40 @@ Format options:
 - Methods section (ready for papers)
 """
 
+import io
 import json
 import hashlib
-from typing import Dict, Any, Optional
-from datetime import datetime
-from dataclasses import dataclass, asdict
-
+import os
+from typing import Dict, Any, Optional, TextIO
+from datetime import date, datetime
+from collections import deque
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+
+from app.core.settings import settings
 from app.db.models import Job, Result
+from app.services.storage_service import sha256_file
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+@dataclass(frozen=True)
 class SoftwareEnvironment:
-    """Software environment details."""
+    """Software environment details (immutable, so it can key caches)."""
     python_version: str
     alphafold_version: Optional[str]
     esmfold_version: Optional[str]
     rosettafold_version: Optional[str]
     cuda_version: Optional[str]
-    dependencies: Dict[str, str]  # package -> version
+    dependencies: tuple[tuple[str, str], ...]  # (package, version) pairs
+
+    def __post_init__(self):
+        if isinstance(self.dependencies, dict):
+            object.__setattr__(self, "dependencies", tuple(self.dependencies.items()))
 
 
 @dataclass
@@ -51,8 +67,20 @@ class HardwareSpecification:
     compute_time_seconds: int
 
 
+class _SerializedSectionsMixin:
+    """Report sections pre-serialized once and shared by every exporter."""
+
+    @cached_property
+    def parameters_json(self) -> str:
+        return _dumps_indented(self.parameters)
+
+    @cached_property
+    def ethics_json(self) -> str:
+        return _dumps_indented(self.ethics_config)
+
+
 @dataclass
-class ReproducibilityReport:
+class ReproducibilityReport(_SerializedSectionsMixin):
     """Complete reproducibility information."""
     # Metadata
     report_version: str = "1.0"
@@ -86,198 +114,454 @@ class ReproducibilityReport:
     # Provenance
     random_seed: Optional[int] = None
     timestamps: Dict[str, str] = None
-    audit_trail: list[str] = None
+    audit_trail: list[str] = None  # most recent entries only
+    audit_event_count: int = 0
+    incremental_audit_hash: str = ""  # IncrementalAuditHash over every event
 
     # Citation
     recommended_citation: str = ""
     doi: Optional[str] = None
 
 
-class ReproducibilityService:
-    """Service for generating reproducibility reports."""
+# Number of most recent audit entries kept verbatim in a report
+_AUDIT_TRAIL_TAIL = 10
 
-    def __init__(self):
-        self.report_version = "1.0"
+# 2**255 - 19 is prime; BLAKE2s digests are 256-bit
+_AUDIT_HASH_MODULUS = 2**255 - 19
 
-    def generate_report(
+
+class IncrementalAuditHash:
+    """
+    Multiset hash over audit events: sum of BLAKE2s digests modulo a prime.
+
+    Each update is O(1) and the result does not depend on event order, so
+    verifiers can recompute it from the persisted audit log and compare.
+    Reports currently build it at report time, in the same single pass over
+    the audit events that collects the bounded tail.
+    """
+
+    def __init__(self, hexdigest: str = ""):
+        self._value = int(hexdigest, 16) if hexdigest else 0
+
+    def update(self, event: str) -> None:
+        digest = hashlib.blake2s(event.encode()).digest()
+        self._value = (self._value + int.from_bytes(digest, "big")) % _AUDIT_HASH_MODULUS
+
+    def hexdigest(self) -> str:
+        return f"{self._value:064x}"
+
+
+class LazyReproducibilityReport(_SerializedSectionsMixin):
+    """
+    Reproducibility report whose expensive sections are computed on demand.
+
+    Exposes the same attributes as ReproducibilityReport. Cheap job fields are
+    copied eagerly; checksums, environment, results, audit trail and citation
+    are only built when an exporter first reads them.
+    """
+
+    def __init__(
         self,
+        service: "ReproducibilityService",
         job: Job,
         result: Optional[Result] = None,
-        include_audit_trail: bool = True
-    ) -> ReproducibilityReport:
-        """
-        Generate complete reproducibility report for a job.
+        include_audit_trail: bool = True,
+    ):
+        self._service = service
+        self._job = job
+        self._result = result
+        self._include_audit_trail = include_audit_trail
+
+        # Metadata
+        self.report_version = service.report_version
+        self.generated_at = datetime.utcnow().isoformat()
+        self.job_id = job.id
+
+        # Experiment
+        self.experiment_type = job.experiment_type
+        self.method = job.method
+        self.sequence = job.sequence
+        self.sequence_length = len(job.sequence)
+
+        # Parameters
+        self.parameters = job.prediction_config or {}
+        self.ethics_config = job.ethics_config or {}
+
+        # Model info
+        self.model_version = service._get_model_version(job.method)
+        self.training_date = None
+
+        # Provenance
+        self.random_seed = None
+        self.timestamps = {
+            "created": job.created_at.isoformat() if job.created_at else None,
+            "started": job.started_at.isoformat() if job.started_at else None,
+            "completed": job.completed_at.isoformat() if job.completed_at else None,
+        }
+        self.doi = None
+
+    @cached_property
+    def sequence_checksum(self) -> str:
+        return self._service._calculate_sequence_hash(self._job.sequence)
+
+    @cached_property
+    def model_checksum(self) -> str:
+        # Weights digests are cached per file, so only the first report pays for the read
+        return self._service._get_model_checksum(self._job.method)
+
+    @cached_property
+    def software(self) -> SoftwareEnvironment:
+        return self._service._get_software_environment()
+
+    @cached_property
+    def hardware(self) -> HardwareSpecification:
+        return self._service._get_hardware_specs(self._job)
+
+    @cached_property
+    def results(self) -> Dict[str, Any]:
+        return self._service._extract_results(self._result) if self._result else {}
+
+    @cached_property
+    def quality_metrics(self) -> Dict[str, float]:
+        return self._service._extract_quality_metrics(self._result) if self._result else {}
+
+    @cached_property
+    def _audit_summary(self) -> tuple[list[str], int, str]:
+        """Single pass over the audit events: bounded tail, count and incremental hash."""
+        if not self._include_audit_trail:
+            return [], 0, ""
+        tail = deque(maxlen=_AUDIT_TRAIL_TAIL)
+        digest = IncrementalAuditHash()
+        count = 0
+        for entry in self._service._get_audit_trail(self._job):
+            tail.append(entry)
+            digest.update(entry)
+            count += 1
+        return list(tail), count, digest.hexdigest()
+
+    @cached_property
+    def audit_trail(self) -> list[str]:
+        return self._audit_summary[0]
+
+    @cached_property
+    def audit_event_count(self) -> int:
+        return self._audit_summary[1]
+
+    @cached_property
+    def incremental_audit_hash(self) -> str:
+        return self._audit_summary[2]
+
+    @cached_property
+    def recommended_citation(self) -> str:
+        return self._service._generate_citation(self._job, self._result)
+
+
+_REPORT_FIELDS = tuple(f.name for f in fields(ReproducibilityReport))
+
+
+def _report_to_dict(report) -> Dict[str, Any]:
+    """
+    Shallow dict view of a (lazy) report for serialization.
+
+    Unlike dataclasses.asdict, nested containers such as parameters, results
+    and the audit trail are passed through by reference instead of deep-copied.
+    """
+    data = {name: getattr(report, name) for name in _REPORT_FIELDS}
+    for key in ("software", "hardware"):
+        section = data[key]
+        if section is not None:
+            data[key] = {f.name: getattr(section, f.name) for f in fields(section)}
+    if data["software"] is not None:
+        data["software"]["dependencies"] = dict(data["software"]["dependencies"])
+    return data
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize to 2-space indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+# Weight file names inside settings.MODEL_WEIGHTS_DIR
+_MODEL_WEIGHT_FILES = {
+    "alphafold3": "af3.bin",
+    "esmfold": "esmfold_3B_v1.pt",
+    "rosettafold2": "RF2_apr23.pt",
+}
+
+@lru_cache(maxsize=8)
+def _checksum_file(path: str, mtime_ns: int, size: int) -> str:
+    """
+    SHA-256 of a (multi-GB) weights file.
+
+    Results are cached per (path, mtime, size), so each weights file is hashed
+    at most once per process unless it changes.
+    """
+    return sha256_file(path)
+
+
+@lru_cache(maxsize=4)
+def _format_dependency_lines(software: SoftwareEnvironment) -> str:
+    """pip-style dependency lines; the environment is effectively constant per process."""
+    return "\n".join(f"{pkg}=={version}" for pkg, version in software.dependencies)
+
+
+@lru_cache(maxsize=1)
+def _citation_year_month(ordinal: int) -> tuple[int, str]:
+    """Citation year and lowercase month abbreviation, computed once per day."""
+    day = date.fromordinal(ordinal)
+    return day.year, day.strftime("%b").lower()
+
+
+_CITATION_TEMPLATE = """@misc{{rexsyn_{job_id},
+  title={{Protein Structure Prediction using {method_name}}},
+  author={{RExSyn Nexus Platform}},
+  year={{{year}}},
+  month={{{month}}},
+  note={{Job ID: {job_id}, pLDDT: {plddt}}},
+  howpublished={{\\url{{https://github.com/flamehaven01/RExSyn-Nexus}}}},
+}}"""
 
-        Args:
-            job: The experiment job
-            result: Optional result data
-            include_audit_trail: Whether to include full audit trail
 
-        Returns:
-            ReproducibilityReport with all details
-        """
-        # Calculate sequence checksum
-        sequence_checksum = self._calculate_sequence_hash(job.sequence)
+_METHODS_TEMPLATE = """### Protein Structure Prediction
 
-        # Build report
-        report = ReproducibilityReport(
-            report_version=self.report_version,
-            generated_at=datetime.utcnow().isoformat(),
-            job_id=job.id,
+Protein structure prediction was performed using {method_name} (version {model_version}). The input sequence ({sequence_length} amino acids) was processed with the following parameters: confidence threshold = {confidence_threshold}, {md_refinement} molecular dynamics refinement.
 
-            # Experiment
-            experiment_type=job.experiment_type,
-            method=job.method,
-            sequence=job.sequence,
-            sequence_length=len(job.sequence),
-            sequence_checksum=sequence_checksum,
-
-            # Parameters
-            parameters=job.prediction_config or {},
-            ethics_config=job.ethics_config or {},
-
-            # Model info
-            model_version=self._get_model_version(job.method),
-            model_checksum=self._get_model_checksum(job.method),
-
-            # Environment
-            software=self._get_software_environment(),
-            hardware=self._get_hardware_specs(job),
-
-            # Results
-            results=self._extract_results(result) if result else {},
-            quality_metrics=self._extract_quality_metrics(result) if result else {},
-
-            # Provenance
-            timestamps={
-                "created": job.created_at.isoformat() if job.created_at else None,
-                "started": job.started_at.isoformat() if job.started_at else None,
-                "completed": job.completed_at.isoformat() if job.completed_at else None,
-            },
-            audit_trail=self._get_audit_trail(job) if include_audit_trail else [],
-
-            # Citation
-            recommended_citation=self._generate_citation(job, result),
-        )
+Computations were executed on {gpu_model} with {gpu_count} GPU(s), requiring approximately {compute_time} seconds. The final structure achieved a pLDDT score of {plddt}, indicating {confidence_word} confidence in the predicted structure.
 
-        return report
+All experiments were conducted using RExSyn Nexus platform (https://github.com/flamehaven01/RExSyn-Nexus) with ethics verification enabled to ensure responsible AI usage in structural biology research.
 
-    def export_to_json(self, report: ReproducibilityReport) -> str:
-        """Export report as JSON."""
-        return json.dumps(asdict(report), indent=2, default=str)
+**Software:** Python {python_version}, {method} {model_version}, CUDA {cuda_version}
 
-    def export_to_markdown(self, report: ReproducibilityReport) -> str:
-        """Export report as human-readable Markdown."""
-        md = f"""# Reproducibility Report
+**Data Availability:** Complete reproducibility report including exact parameters, model checksums, and audit trail is available as supplementary material (Job ID: {job_id}).
+"""
+
+
+# Compiled once at import; write_markdown formats and streams one section at a time.
+_MARKDOWN_SECTIONS = (
+    """# Reproducibility Report
 
-**Generated**: {report.generated_at}
-**Job ID**: {report.job_id}
-**Report Version**: {report.report_version}
+**Generated**: {r.generated_at}
+**Job ID**: {r.job_id}
+**Report Version**: {r.report_version}
 
 ---
 
-## Experiment Details
+""",
+    """## Experiment Details
 
-- **Type**: {report.experiment_type}
-- **Method**: {report.method}
-- **Sequence Length**: {report.sequence_length} amino acids
-- **Sequence Checksum**: `{report.sequence_checksum[:16]}...`
+- **Type**: {r.experiment_type}
+- **Method**: {r.method}
+- **Sequence Length**: {r.sequence_length} amino acids
+- **Sequence Checksum**: `{sequence_checksum_short}...`
 
-## Input Sequence
+""",
+    """## Input Sequence
 
 ```
-{report.sequence[:60]}{'...' if len(report.sequence) > 60 else ''}
+{sequence_preview}
 ```
 
-## Parameters
+""",
+    """## Parameters
 
 ### Prediction Configuration
 ```json
-{json.dumps(report.parameters, indent=2)}
+{parameters_json}
 ```
 
 ### Ethics Configuration
 ```json
-{json.dumps(report.ethics_config, indent=2)}
+{ethics_json}
 ```
 
-## Model Information
+""",
+    """## Model Information
 
-- **Model Version**: {report.model_version}
-- **Model Checksum**: `{report.model_checksum[:16]}...`
-- **Training Date**: {report.training_date or 'N/A'}
+- **Model Version**: {r.model_version}
+- **Model Checksum**: `{model_checksum_short}...`
+- **Training Date**: {training_date}
 
-## Software Environment
+""",
+    """## Software Environment
 
-- **Python**: {report.software.python_version if report.software else 'N/A'}
-- **AlphaFold**: {report.software.alphafold_version if report.software else 'N/A'}
-- **ESMFold**: {report.software.esmfold_version if report.software else 'N/A'}
-- **CUDA**: {report.software.cuda_version if report.software else 'N/A'}
+- **Python**: {python_version}
+- **AlphaFold**: {alphafold_version}
+- **ESMFold**: {esmfold_version}
+- **CUDA**: {cuda_version}
 
 ### Dependencies
 ```
-{self._format_dependencies(report.software) if report.software else 'N/A'}
+{dependencies}
 ```
 
-## Hardware Specification
+""",
+    """## Hardware Specification
 
-- **GPU**: {report.hardware.gpu_model if report.hardware else 'N/A'} (x{report.hardware.gpu_count if report.hardware else 0})
-- **CPU Cores**: {report.hardware.cpu_cores if report.hardware else 'N/A'}
-- **RAM**: {report.hardware.ram_gb if report.hardware else 'N/A'} GB
-- **Compute Time**: {report.hardware.compute_time_seconds if report.hardware else 'N/A'} seconds
+- **GPU**: {gpu_model} (x{gpu_count})
+- **CPU Cores**: {cpu_cores}
+- **RAM**: {ram_gb} GB
+- **Compute Time**: {compute_time} seconds
 
-## Results
+""",
+    """## Results
 
 ### Quality Metrics
 ```json
-{json.dumps(report.quality_metrics, indent=2)}
+{quality_json}
 ```
 
-## Timestamps
+""",
+    """## Timestamps
 
-- **Created**: {report.timestamps.get('created', 'N/A')}
-- **Started**: {report.timestamps.get('started', 'N/A')}
-- **Completed**: {report.timestamps.get('completed', 'N/A')}
+- **Created**: {created}
+- **Started**: {started}
+- **Completed**: {completed}
 
-## Citation
+""",
+    """## Citation
 
 To cite this experiment in your work:
 
 ```bibtex
-{report.recommended_citation}
+{r.recommended_citation}
 ```
 
 ---
 
-## Audit Trail
+""",
+)
 
-{chr(10).join(f'- {entry}' for entry in (report.audit_trail or [])[:10])}
-{f'... and {len(report.audit_trail) - 10} more entries' if report.audit_trail and len(report.audit_trail) > 10 else ''}
+_MARKDOWN_AUDIT_HEADING = "## Audit Trail\n\n"
+
+_MARKDOWN_FOOTER = """{audit_summary}
 
 ---
 
 **Generated by RExSyn Nexus Reproducibility Service**
-*Report Version {report.report_version}*
+*Report Version {r.report_version}*
 """
-        return md
 
-    def export_methods_section(self, report: ReproducibilityReport) -> str:
+
+class ReproducibilityService:
+    """Service for generating reproducibility reports."""
+
+    def __init__(self):
+        self.report_version = "1.0"
+
+    def generate_report(
+        self,
+        job: Job,
+        result: Optional[Result] = None,
+        include_audit_trail: bool = True
+    ) -> LazyReproducibilityReport:
         """
-        Export as ready-to-use Methods section for scientific papers.
+        Generate complete reproducibility report for a job.
+
+        Sections are computed lazily, so exporters that only read a subset
+        (e.g. the methods section) never pay for the rest.
+
+        Args:
+            job: The experiment job
+            result: Optional result data
+            include_audit_trail: Whether to include full audit trail
+
+        Returns:
+            LazyReproducibilityReport with all details
         """
-        methods = f"""### Protein Structure Prediction
+        return LazyReproducibilityReport(self, job, result, include_audit_trail)
 
-Protein structure prediction was performed using {self._get_method_name(report.method)} (version {report.model_version}). The input sequence ({report.sequence_length} amino acids) was processed with the following parameters: confidence threshold = {report.parameters.get('confidence_threshold', 'default')}, {"with" if report.parameters.get('enable_md_refinement') else "without"} molecular dynamics refinement.
+    def export_to_json(self, report: ReproducibilityReport) -> str:
+        """Export report as JSON."""
+        return _dumps_indented(_report_to_dict(report))
 
-Computations were executed on {report.hardware.gpu_model if report.hardware else 'GPU hardware'} with {report.hardware.gpu_count if report.hardware else 'N/A'} GPU(s), requiring approximately {report.hardware.compute_time_seconds if report.hardware else 'N/A'} seconds. The final structure achieved a pLDDT score of {report.quality_metrics.get('plddt_score', 'N/A')}, indicating {"high" if report.quality_metrics.get('plddt_score', 0) > 80 else "moderate"} confidence in the predicted structure.
+    def export_to_markdown(self, report: ReproducibilityReport) -> str:
+        """Export report as human-readable Markdown."""
+        buffer = io.StringIO()
+        self.write_markdown(report, buffer)
+        return buffer.getvalue()
 
-All experiments were conducted using RExSyn Nexus platform (https://github.com/flamehaven01/RExSyn-Nexus) with ethics verification enabled to ensure responsible AI usage in structural biology research.
+    def write_markdown(self, report: ReproducibilityReport, fp: TextIO) -> None:
+        """
+        Stream the Markdown report to a text file-like object.
 
-**Software:** Python {report.software.python_version if report.software else 'N/A'}, {report.method} {report.model_version}, CUDA {report.software.cuda_version if report.software else 'N/A'}
+        Sections are formatted and written one at a time, so callers writing to
+        a file or chunked response never hold the whole document in memory.
+        """
+        software = report.software
+        hardware = report.hardware
+        timestamps = report.timestamps or {}
+        audit_trail = report.audit_trail or []
+        recent = audit_trail[-_AUDIT_TRAIL_TAIL:]
+        event_count = max(report.audit_event_count or 0, len(audit_trail))
+
+        ctx = {
+            "r": report,
+            "sequence_checksum_short": report.sequence_checksum[:16],
+            "sequence_preview": report.sequence[:60] + ("..." if len(report.sequence) > 60 else ""),
+            "parameters_json": report.parameters_json,
+            "ethics_json": report.ethics_json,
+            "model_checksum_short": report.model_checksum[:16],
+            "training_date": report.training_date or "N/A",
+            "python_version": software.python_version if software else "N/A",
+            "alphafold_version": software.alphafold_version if software else "N/A",
+            "esmfold_version": software.esmfold_version if software else "N/A",
+            "cuda_version": software.cuda_version if software else "N/A",
+            "dependencies": self._format_dependencies(software) if software else "N/A",
+            "gpu_model": hardware.gpu_model if hardware else "N/A",
+            "gpu_count": hardware.gpu_count if hardware else 0,
+            "cpu_cores": hardware.cpu_cores if hardware else "N/A",
+            "ram_gb": hardware.ram_gb if hardware else "N/A",
+            "compute_time": hardware.compute_time_seconds if hardware else "N/A",
+            "quality_json": _dumps_indented(report.quality_metrics),
+            "created": timestamps.get("created", "N/A"),
+            "started": timestamps.get("started", "N/A"),
+            "completed": timestamps.get("completed", "N/A"),
+            "audit_summary": (
+                f"\n**Audit Hash**: `{report.incremental_audit_hash[:16]}...` ({event_count} events)"
+                if report.incremental_audit_hash else ""
+            ),
+        }
 
-**Data Availability:** Complete reproducibility report including exact parameters, model checksums, and audit trail is available as supplementary material (Job ID: {report.job_id}).
-"""
-        return methods
+        for section in _MARKDOWN_SECTIONS:
+            fp.write(section.format_map(ctx))
+
+        fp.write(_MARKDOWN_AUDIT_HEADING)
+        if event_count > len(recent):
+            fp.write(f"... {event_count - len(recent)} earlier entries omitted\n")
+        for entry in recent:
+            fp.write(f"- {entry}\n")
+        if not recent:
+            fp.write("\n")
+        fp.write(_MARKDOWN_FOOTER.format_map(ctx))
+
+    def export_methods_section(self, report: ReproducibilityReport) -> str:
+        """
+        Export as ready-to-use Methods section for scientific papers.
+        """
+        parameters = report.parameters or {}
+        quality = report.quality_metrics or {}
+        hardware = report.hardware
+        software = report.software
+        plddt = quality.get("plddt_score", "N/A")
+
+        return _METHODS_TEMPLATE.format_map({
+            "method_name": self._get_method_name(report.method),
+            "method": report.method,
+            "model_version": report.model_version,
+            "sequence_length": report.sequence_length,
+            "confidence_threshold": parameters.get("confidence_threshold", "default"),
+            "md_refinement": "with" if parameters.get("enable_md_refinement") else "without",
+            "gpu_model": hardware.gpu_model if hardware else "GPU hardware",
+            "gpu_count": hardware.gpu_count if hardware else "N/A",
+            "compute_time": hardware.compute_time_seconds if hardware else "N/A",
+            "plddt": plddt,
+            "confidence_word": "high" if quality.get("plddt_score", 0) > 80 else "moderate",
+            "python_version": software.python_version if software else "N/A",
+            "cuda_version": software.cuda_version if software else "N/A",
+            "job_id": report.job_id,
+        })
 
     def _calculate_sequence_hash(self, sequence: str) -> str:
         """Calculate SHA256 hash of sequence."""
@@ -295,8 +579,16 @@ All experiments were conducted using RExSyn Nexus platform (https://github.com/f
 
     def _get_model_checksum(self, method: str) -> str:
         """Get model weights checksum."""
-        # This would calculate actual checksum of model files
-        # Placeholder for now
+        weights_file = _MODEL_WEIGHT_FILES.get(method)
+        if settings.MODEL_WEIGHTS_DIR and weights_file:
+            path = os.path.join(settings.MODEL_WEIGHTS_DIR, weights_file)
+            try:
+                st = os.stat(path)
+            except OSError:
+                pass
+            else:
+                return f"sha256:{_checksum_file(path, st.st_mtime_ns, st.st_size)}"
+        # Placeholder until model weights are mounted
         return "sha256:1234567890abcdef" * 4
 
     def _get_software_environment(self) -> SoftwareEnvironment:
@@ -309,12 +601,12 @@ All experiments were conducted using RExSyn Nexus platform (https://github.com/f
             esmfold_version="1.0.3",
             rosettafold_version="2.1.0",
             cuda_version="12.1",
-            dependencies={
-                "numpy": "1.26.4",
-                "scipy": "1.12.0",
-                "torch": "2.2.0",
-                "biopython": "1.83",
-            }
+            dependencies=(
+                ("numpy", "1.26.4"),
+                ("scipy", "1.12.0"),
+                ("torch", "2.2.0"),
+                ("biopython", "1.83"),
+            )
         )
 
     def _get_hardware_specs(self, job: Job) -> HardwareSpecification:
@@ -360,17 +652,15 @@ All experiments were conducted using RExSyn Nexus platform (https://github.com/f
 
     def _generate_citation(self, job: Job, result: Optional[Result]) -> str:
         """Generate BibTeX citation."""
-        year = datetime.now().year
-        month = datetime.now().strftime("%b").lower()
+        year, month = _citation_year_month(date.today().toordinal())
 
-        return f"""@misc{{rexsyn_{job.id},
-  title={{Protein Structure Prediction using {self._get_method_name(job.method)}}},
-  author={{RExSyn Nexus Platform}},
-  year={{{year}}},
-  month={{{month}}},
-  note={{Job ID: {job.id}, pLDDT: {result.plddt_score if result else 'N/A'}}},
-  howpublished={{\\url{{https://github.com/flamehaven01/RExSyn-Nexus}}}},
-}}"""
+        return _CITATION_TEMPLATE.format(
+            job_id=job.id,
+            method_name=self._get_method_name(job.method),
+            year=year,
+            month=month,
+            plddt=result.plddt_score if result else 'N/A',
+        )
 
     def _get_method_name(self, method: str) -> str:
         """Get full method name."""
@@ -385,4 +675,4 @@ All experiments were conducted using RExSyn Nexus platform (https://github.com/f
         """Format dependencies list."""
         if not software or not software.dependencies:
             return "N/A"
-        return "\n".join(f"{pkg}=={version}" for pkg, version in software.dependencies.items())
+        return _format_dependency_lines(software)
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 import logging
 import math
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -13,43 +15,65 @@ class RiskParams:
 class RiskModel:
     def __init__(self, params: RiskParams = RiskParams()):
         self.p = params
-        logger.info(f"RiskModel initialized with lambda0={params.lambda0:.3f}, alpha={params.alpha:.2f}")
+        logger.info("RiskModel initialized with lambda0=%.3f, alpha=%.2f", params.lambda0, params.alpha)
 
     def lambda_t(self, deploy_rate_t: float) -> float:
         r = self.p.deploy_rate_ref/max(deploy_rate_t, 1e-6)
         lam = self.p.lambda0 * (r ** self.p.alpha)
-        clamped_lam = max(0.03, min(0.25, lam))
-        logger.debug(f"lambda_t: deploy_rate={deploy_rate_t:.2f} -> lambda={clamped_lam:.4f}")
+        clamped_lam = 0.03 if lam < 0.03 else (0.25 if lam > 0.25 else lam)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("lambda_t: deploy_rate=%.2f -> lambda=%.4f", deploy_rate_t, clamped_lam)
         return clamped_lam
 
+    def lambda_t_batch(self, deploy_rate_t) -> np.ndarray:
+        """Vectorized lambda_t over an array-like of deploy rates."""
+        r = self.p.deploy_rate_ref/np.maximum(np.asarray(deploy_rate_t, dtype=np.float64), 1e-6)
+        return np.clip(self.p.lambda0 * (r ** self.p.alpha), 0.03, 0.25)
+
     def effective_risk(self, base_risk: float, days_since_change: float, deploy_rate_t: float) -> float:
         lam = self.lambda_t(deploy_rate_t)
         risk = base_risk * math.exp(-lam * days_since_change)
-        logger.info(f"Effective risk: base={base_risk:.3f}, days={days_since_change:.1f}, deploy_rate={deploy_rate_t:.2f} -> risk={risk:.4f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Effective risk: base=%.3f, days=%.1f, deploy_rate=%.2f -> risk=%.4f",
+                base_risk, days_since_change, deploy_rate_t, risk,
+            )
+        return risk
+
+    def effective_risk_batch(self, base_risk, days_since_change, deploy_rate_t) -> np.ndarray:
+        """Vectorized effective_risk over array-likes (broadcast against each other)."""
+        base = np.asarray(base_risk, dtype=np.float64)
+        days = np.asarray(days_since_change, dtype=np.float64)
+
+        lam = self.lambda_t_batch(deploy_rate_t)
+        risk = base * np.exp(-lam * days)
+        logger.debug("Effective risk batch: %d rows scored", risk.size)
         return risk
 
 class Calibrator:
     def fit(self, rows):
-        logger.info(f"Starting risk model calibration with {len(rows)} data points")
+        logger.info("Starting risk model calibration with %d data points", len(rows))
 
         try:
-            xs=[]; ys=[]
-            for dr, dsc, inc in rows:
-                xs.append((1.0/max(dr,1e-3), dsc)); ys.append(inc)
-
-            s11 = sum(a*a for a,b in xs) + 1e-3
-            s22 = sum(b*b for a,b in xs) + 1e-3
-            y1  = sum(y*a for (a,b),y in zip(xs,ys))
-            y2  = sum(y*b for (a,b),y in zip(xs,ys))
+            arr = np.asarray(rows, dtype=np.float64) if len(rows) else np.empty((0, 3))
+            if arr.ndim != 2 or arr.shape[1] != 3:
+                raise ValueError(f"expected (dr, dsc, inc) rows, got array of shape {arr.shape}")
+            dr, dsc, inc = arr.T
+            a = 1.0/np.maximum(dr, 1e-3)
+
+            s11 = float(a@a) + 1e-3
+            s22 = float(dsc@dsc) + 1e-3
+            y1  = float(inc@a)
+            y2  = float(inc@dsc)
             w1 = y1/s11; w2 = y2/s22
 
             lambda0 = min(0.25, max(0.03, abs(w1)))
             alpha   = max(0.1, min(3.0, abs(w2)/max(w1,1e-6)))
 
-            logger.info(f"Calibration complete: lambda0={lambda0:.4f}, alpha={alpha:.3f}")
+            logger.info("Calibration complete: lambda0=%.4f, alpha=%.3f", lambda0, alpha)
             return RiskParams(lambda0=lambda0, alpha=alpha, deploy_rate_ref=10.0)
 
         except Exception as e:
-            logger.error(f"Risk calibration failed: {e}")
+            logger.error("Risk calibration failed: %s", e)
             logger.warning("Falling back to default RiskParams")
             return RiskParams()
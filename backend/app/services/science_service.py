@@ -1,9 +1,20 @@
+import hashlib
 import logging
 import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, Any, Optional
 
 from app.core.settings import settings
+from app.services.storage_service import sha256_file
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +28,13 @@ class ScienceService:
     real calculators or set mode="external" after wiring actual tools.
     """
 
-    def __init__(self, mode: Optional[str] = None):
+    def __init__(self, mode: Optional[str] = None, cache_dir: Optional[str] = None):
         self.mode = (mode or settings.SCIENCE_MODE or "placeholder").lower()
         self.posebusters_cmd = settings.POSEBUSTERS_CMD
         self.dockq_cmd = settings.DOCKQ_CMD
         self.saxs_cmd = settings.SAXS_CMD
+        cache_dir = cache_dir or settings.SCIENCE_CACHE_DIR
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
     def evaluate_structure(self, pdb_path: str, saxs_enabled: bool = True) -> Dict[str, Any]:
         """
@@ -84,30 +97,43 @@ class ScienceService:
             bool(self.dockq_cmd),
             bool(self.saxs_cmd),
         )
+        digest = self._content_digest(pdb_path)
+
+        # The calculators are independent reads of the same structure, so run
+        # them concurrently; subprocess waits release the GIL.
+        commands = {
+            "posebusters": self.posebusters_cmd,
+            "dockq": self.dockq_cmd,
+            "saxs": self.saxs_cmd if saxs_enabled else "",
+        }
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            futures = {
+                name: executor.submit(self._exec_json_cached, cmd, pdb_path, digest)
+                for name, cmd in commands.items()
+                if cmd
+            }
+        outputs = {name: future.result() for name, future in futures.items()}
 
         # PoseBusters
-        if self.posebusters_cmd:
-            out = self._exec_json(self.posebusters_cmd, [pdb_path])
-            if out:
-                results["posebusters_pass_ratio"] = self._as_float(
-                    out.get("pass_ratio") or out.get("pass_rate")
-                )
+        out = outputs.get("posebusters")
+        if out:
+            results["posebusters_pass_ratio"] = self._as_float(
+                out.get("pass_ratio") or out.get("pass_rate")
+            )
 
         # DockQ
-        if self.dockq_cmd:
-            out = self._exec_json(self.dockq_cmd, [pdb_path])
-            if out:
-                results["dockq_score"] = self._as_float(
-                    out.get("dockq") or out.get("dockq_score")
-                )
+        out = outputs.get("dockq")
+        if out:
+            results["dockq_score"] = self._as_float(
+                out.get("dockq") or out.get("dockq_score")
+            )
 
         # SAXS
-        if saxs_enabled and self.saxs_cmd:
-            out = self._exec_json(self.saxs_cmd, [pdb_path])
-            if out:
-                results["saxs_chi2"] = self._as_float(
-                    out.get("chi2") or out.get("saxs_chi2") or out.get("reduced_chi2")
-                )
+        out = outputs.get("saxs")
+        if out:
+            results["saxs_chi2"] = self._as_float(
+                out.get("chi2") or out.get("saxs_chi2") or out.get("reduced_chi2")
+            )
 
         # Fallback if missing values
         results.setdefault("dockq_score", 0.78)
@@ -117,19 +143,63 @@ class ScienceService:
 
         return results
 
+    def _exec_json_cached(self, cmd: str, pdb_path: str, digest: Optional[str]) -> Optional[dict]:
+        """
+        Run a calculator on pdb_path, reusing stored output for identical inputs.
+
+        Results are keyed on the command plus the SHA-256 of the structure file
+        contents, so a re-run on an unchanged file skips the subprocess.
+        """
+        if self.cache_dir is None or digest is None:
+            return self._exec_json(cmd, [pdb_path])
+
+        key = hashlib.sha256(f"{cmd}\0{digest}".encode()).hexdigest()
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            cached = json.loads(cache_file.read_text())
+            logger.info("ScienceService cache hit (%s): %s", cmd, pdb_path)
+            return cached
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("ScienceService cache entry unreadable (%s): %s", cache_file, e)
+
+        out = self._exec_json(cmd, [pdb_path])
+        if out is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                tmp_file.write_text(json.dumps(out))
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                logger.warning("ScienceService cache write failed (%s): %s", cache_file, e)
+        return out
+
+    def _content_digest(self, pdb_path: str) -> Optional[str]:
+        """SHA-256 of the structure file; None if caching is off or unreadable."""
+        if self.cache_dir is None:
+            return None
+        try:
+            return sha256_file(pdb_path)
+        except OSError:
+            return None
+
     def _exec_json(self, cmd: str, args: list) -> Optional[dict]:
         """Run a CLI command and parse JSON stdout."""
         try:
+            # Keep stdout as bytes: both parsers accept UTF-8 bytes directly.
             completed = subprocess.run(
                 [cmd] + args,
                 capture_output=True,
-                text=True,
                 timeout=300,
                 check=True,
             )
-            return json.loads(completed.stdout.strip() or "{}")
+            stdout = completed.stdout.strip() or b"{}"
+            return orjson.loads(stdout) if ORJSON_AVAILABLE else json.loads(stdout)
         except Exception as e:
-            stderr = getattr(e, "stderr", "")
+            stderr = getattr(e, "stderr", None) or b""
+            if isinstance(stderr, bytes):
+                stderr = stderr[:300].decode("utf-8", errors="replace")
             logger.warning(
                 "ScienceService external command failed (%s): %s %s",
                 cmd,
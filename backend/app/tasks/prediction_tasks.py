@@ -21,23 +21,48 @@ except Exception:  # pragma: no cover - light mode fallback
             return decorator
     celery_app = _StubCelery()
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import gzip
+import json
 import logging
 import traceback
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import os
 
-from app.db.database import SessionLocal
-from app.db.models import Job, Result, AuditLog, JobStatus, FileStorage, calculate_job_expiration
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:  # pragma: no cover - gzip fallback
+    ZSTD_AVAILABLE = False
+
+from sqlalchemy import bindparam, delete, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.core.settings import settings
+from app.db.database import SessionLocal, _json_deserializer, _json_serializer
+from app.db.models import (
+    Job, Result, AuditLog, Checkpoint, JobStatus, FileStorage, SystemConfig, calculate_job_expiration
+)
 from app.services.peer_review_service import PeerReviewService
+from app.services.progress_service import publish_progress
 from app.services.md_refinement import MDRefinementService
 from app.services.science_service import ScienceService
 from app.instrumentation import metrics
-from app.services.storage_service import get_storage_service, upload_job_file
+from app.services.storage_service import get_job_storage_prefix, get_storage_service, upload_job_file
 from app.services.report_generator import generate_academic_report
 
 logger = logging.getLogger(__name__)
 ALLOW_PLACEHOLDER = os.getenv("ALLOW_PLACEHOLDER_PIPELINE", "1") == "1"
+CLEANUP_BATCH_SIZE = 1000
+# Tables holding per-job rows, deleted along with their job
+_JOB_CHILD_MODELS = (FileStorage, AuditLog, Checkpoint, Result)
+_CLEANUP_CURSOR_KEY = "cleanup.expired_jobs.cursor"
+
+# Shared by cleanup runs in this process; storage deletes are I/O-bound
+_CLEANUP_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="job-cleanup")
 
 
 class PredictionTask(Task):
@@ -49,8 +74,10 @@ class PredictionTask(Task):
 
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         """Handle task failure."""
+        # ExceptionInfo already carries the formatted traceback text
+        tb = getattr(einfo, "traceback", None) or str(einfo)
         logger.error(f"Task {task_id} failed: {exc}")
-        logger.error(f"Traceback: {einfo}")
+        logger.error(f"Traceback: {tb}")
 
         # Update job status in database
         db = SessionLocal()
@@ -61,7 +88,7 @@ class PredictionTask(Task):
                 if job:
                     job.status = JobStatus.FAILED
                     job.error_message = str(exc)
-                    job.error_traceback = str(einfo)
+                    job.error_traceback = tb
                     db.commit()
         finally:
             db.close()
@@ -108,6 +135,7 @@ def run_structure_prediction(
         dict with job results
     """
     db = SessionLocal()
+    last_progress: Dict[str, Any] = {}
 
     try:
         # Get job from database
@@ -122,10 +150,13 @@ def run_structure_prediction(
 
         logger.info(f"Starting prediction for job {job_id}")
 
+        # One round-trip for every checkpoint this job already has (resume path)
+        checkpoints = _load_checkpoints(db, job_id)
+
         # ========================================================================
         # CHECKPOINT 1: Semantic Routing
         # ========================================================================
-        checkpoint = _load_checkpoint(db, job_id, "semantic_routing")
+        checkpoint = checkpoints.get("semantic_routing")
         if not checkpoint:
             logger.info(f"[{job_id}] Stage 1/8: Semantic Routing")
             _create_audit_log(db, job_id, "Semantic Routing", 0, "started")
@@ -138,18 +169,16 @@ def run_structure_prediction(
                 "experiment_type": request_data["experiment_type"]
             }
 
-            _save_checkpoint(db, job_id, "semantic_routing", routing_result)
+            _save_checkpoint(db, checkpoints, job_id, "semantic_routing", routing_result)
             _create_audit_log(db, job_id, "Semantic Routing", 0, "completed", routing_result)
 
-            job.current_stage = "Semantic Routing"
-            job.stage_index = 0
-            job.progress = 0.14
+            _record_progress(job, last_progress, "Semantic Routing", 0, 0.14)
             db.commit()
 
         # ========================================================================
         # CHECKPOINT 2: LLM Drift Check
         # ========================================================================
-        checkpoint = _load_checkpoint(db, job_id, "drift_check")
+        checkpoint = checkpoints.get("drift_check")
         if not checkpoint:
             logger.info(f"[{job_id}] Stage 2/8: LLM Drift Check")
             _create_audit_log(db, job_id, "LLM Drift Check", 1, "started")
@@ -163,18 +192,16 @@ def run_structure_prediction(
                 "status": "clean"
             }
 
-            _save_checkpoint(db, job_id, "drift_check", drift_result)
+            _save_checkpoint(db, checkpoints, job_id, "drift_check", drift_result)
             _create_audit_log(db, job_id, "LLM Drift Check", 1, "completed", drift_result)
 
-            job.current_stage = "LLM Drift Check"
-            job.stage_index = 1
-            job.progress = 0.28
+            _record_progress(job, last_progress, "LLM Drift Check", 1, 0.28)
             db.commit()
 
         # ========================================================================
         # CHECKPOINT 3: Structure Prediction (Main Computation)
         # ========================================================================
-        checkpoint = _load_checkpoint(db, job_id, "structure_prediction")
+        checkpoint = checkpoints.get("structure_prediction")
         if not checkpoint:
             logger.info(f"[{job_id}] Stage 3/8: Structure Prediction")
             _create_audit_log(db, job_id, "Structure Prediction", 2, "started")
@@ -189,24 +216,22 @@ def run_structure_prediction(
                 "plddt_array": [85.0] * 250,  # Mock pLDDT scores
             }
 
-            _save_checkpoint(db, job_id, "structure_prediction", prediction_result)
+            _save_checkpoint(db, checkpoints, job_id, "structure_prediction", prediction_result)
             _create_audit_log(db, job_id, "Structure Prediction", 2, "completed", prediction_result)
 
-            job.current_stage = "Structure Prediction"
-            job.stage_index = 2
-            job.progress = 0.42
+            _record_progress(job, last_progress, "Structure Prediction", 2, 0.42)
             db.commit()
 
         # ========================================================================
         # CHECKPOINT 4: Scientific Validation (DockQ v2, SAXS χ², PoseBusters v2)
         # ========================================================================
-        sci_checkpoint = _load_checkpoint(db, job_id, "scientific_validation")
+        sci_checkpoint = checkpoints.get("scientific_validation")
         if not sci_checkpoint:
             logger.info(f"[{job_id}] Stage 4/8: Scientific Validation")
             _create_audit_log(db, job_id, "Scientific Validation", 3, "started")
 
-            science = ScienceService()
-            structure_checkpoint = _load_checkpoint(db, job_id, "structure_prediction") or {}
+            science = _get_science_service()
+            structure_checkpoint = checkpoints.get("structure_prediction") or {}
             pdb_path = structure_checkpoint.get("pdb_file") or f"/tmp/{job_id}_predicted.pdb"
             sci_result = science.evaluate_structure(
                 pdb_path=pdb_path,
@@ -225,18 +250,16 @@ def run_structure_prediction(
             except Exception as e:
                 logger.warning(f"[{job_id}] Metric export failed: {e}")
 
-            _save_checkpoint(db, job_id, "scientific_validation", sci_result)
+            _save_checkpoint(db, checkpoints, job_id, "scientific_validation", sci_result)
             _create_audit_log(db, job_id, "Scientific Validation", 3, "completed", sci_result)
 
-            job.current_stage = "Scientific Validation"
-            job.stage_index = 3
-            job.progress = 0.56
+            _record_progress(job, last_progress, "Scientific Validation", 3, 0.56)
             db.commit()
 
         # ========================================================================
         # CHECKPOINT 4: Policy Check
         # ========================================================================
-        checkpoint = _load_checkpoint(db, job_id, "policy_check")
+        checkpoint = checkpoints.get("policy_check")
         if not checkpoint:
             logger.info(f"[{job_id}] Stage 5/8: Policy Check")
             _create_audit_log(db, job_id, "Policy Check", 3, "started")
@@ -248,19 +271,17 @@ def run_structure_prediction(
                 "checks": ["biosafety", "dual_use", "ethics"]
             }
 
-            _save_checkpoint(db, job_id, "policy_check", policy_result)
+            _save_checkpoint(db, checkpoints, job_id, "policy_check", policy_result)
             _create_audit_log(db, job_id, "Policy Check", 3, "completed", policy_result)
 
-            job.current_stage = "Policy Check"
-            job.stage_index = 4
-            job.progress = 0.64
+            _record_progress(job, last_progress, "Policy Check", 4, 0.64)
             db.commit()
 
         # ========================================================================
         # CHECKPOINT 5: MD Refinement (Optional)
         # ========================================================================
         if request_data.get("prediction_config", {}).get("md_refinement_auto"):
-            checkpoint = _load_checkpoint(db, job_id, "md_refinement")
+            checkpoint = checkpoints.get("md_refinement")
             if not checkpoint:
                 logger.info(f"[{job_id}] Stage 6/8: MD Refinement")
                 _create_audit_log(db, job_id, "MD Refinement", 4, "started")
@@ -275,18 +296,16 @@ def run_structure_prediction(
                     "energy": -120000,
                 }
 
-                _save_checkpoint(db, job_id, "md_refinement", md_result)
+                _save_checkpoint(db, checkpoints, job_id, "md_refinement", md_result)
                 _create_audit_log(db, job_id, "MD Refinement", 4, "completed", md_result)
 
-                job.current_stage = "MD Refinement"
-                job.stage_index = 5
-                job.progress = 0.76
+                _record_progress(job, last_progress, "MD Refinement", 5, 0.76)
                 db.commit()
 
         # ========================================================================
         # CHECKPOINT 6: Ethics Certification
         # ========================================================================
-        checkpoint = _load_checkpoint(db, job_id, "ethics_certification")
+        checkpoint = checkpoints.get("ethics_certification")
         if not checkpoint:
             logger.info(f"[{job_id}] Stage 7/8: Ethics Certification")
             _create_audit_log(db, job_id, "Ethics Certification", 5, "started")
@@ -300,18 +319,16 @@ def run_structure_prediction(
                 "threshold": ove_threshold
             }
 
-            _save_checkpoint(db, job_id, "ethics_certification", ethics_result)
+            _save_checkpoint(db, checkpoints, job_id, "ethics_certification", ethics_result)
             _create_audit_log(db, job_id, "Ethics Certification", 5, "completed", ethics_result)
 
-            job.current_stage = "Ethics Certification"
-            job.stage_index = 6
-            job.progress = 0.88
+            _record_progress(job, last_progress, "Ethics Certification", 6, 0.88)
             db.commit()
 
         # ========================================================================
         # CHECKPOINT 7: Generate Report
         # ========================================================================
-        checkpoint = _load_checkpoint(db, job_id, "report_generation")
+        checkpoint = checkpoints.get("report_generation")
         if not checkpoint:
             logger.info(f"[{job_id}] Stage 8/8: Report Generation")
             _create_audit_log(db, job_id, "Report Generation", 6, "started")
@@ -334,19 +351,17 @@ def run_structure_prediction(
                 "report_path": f"/tmp/{job_id}_report.pdf"
             }
 
-            _save_checkpoint(db, job_id, "report_generation", report_result)
+            _save_checkpoint(db, checkpoints, job_id, "report_generation", report_result)
             _create_audit_log(db, job_id, "Report Generation", 6, "completed", report_result)
 
-            job.current_stage = "Report Generation"
-            job.stage_index = 7
-            job.progress = 1.0
+            _record_progress(job, last_progress, "Report Generation", 7, 1.0)
             db.commit()
 
         # ========================================================================
         # Save Results to Database
         # ========================================================================
-        sci_checkpoint = _load_checkpoint(db, job_id, "scientific_validation") or {}
-        struct_checkpoint = _load_checkpoint(db, job_id, "structure_prediction") or {}
+        sci_checkpoint = checkpoints.get("scientific_validation") or {}
+        struct_checkpoint = checkpoints.get("structure_prediction") or {}
 
         result = db.query(Result).filter(Result.job_id == job_id).first()
         if not result:
@@ -366,7 +381,10 @@ def run_structure_prediction(
         result.pdb_file_path = struct_checkpoint.get("pdb_file")
         result.refined_pdb_file_path = struct_checkpoint.get("refined_pdb")
 
-        # Update job completion
+        # Update job completion (live progress may only have gone to Redis)
+        job.current_stage = "Report Generation"
+        job.stage_index = 7
+        job.progress = 1.0
         job.status = JobStatus.COMPLETED
         job.completed_at = datetime.now(timezone.utc)
         started_at = job.started_at or job.created_at or datetime.now(timezone.utc)
@@ -387,13 +405,19 @@ def run_structure_prediction(
         }
 
     except Exception as e:
+        tb = traceback.format_exc()
         logger.error(f"Job {job_id} failed: {e}")
-        logger.error(traceback.format_exc())
-
-        # Update job status
+        logger.error(tb)
+
+        # Update job status, persisting the last stage reached (with Redis
+        # progress it was never written to the row)
+        if last_progress:
+            job.current_stage = last_progress["stage"]
+            job.stage_index = last_progress["stage_index"]
+            job.progress = last_progress["progress"]
         job.status = JobStatus.FAILED
         job.error_message = str(e)
-        job.error_traceback = traceback.format_exc()
+        job.error_traceback = tb
         db.commit()
 
         raise
@@ -402,36 +426,125 @@ def run_structure_prediction(
         db.close()
 
 
+# ============================================================================
+# Service Singletons
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def _get_science_service() -> ScienceService:
+    """Per-process ScienceService, shared by every task the worker runs."""
+    return ScienceService()
+
+
 # ============================================================================
 # Checkpoint Helpers
 # ============================================================================
 
-def _save_checkpoint(db, job_id: str, stage_name: str, data: dict):
-    """Save checkpoint for resumability."""
-    # Store checkpoint as audit log with special flag
-    audit = AuditLog(
-        job_id=job_id,
-        stage_name=f"checkpoint:{stage_name}",
-        status="checkpoint",
-        metrics=data,
-        created_at=datetime.now(timezone.utc)
-    )
-    db.add(audit)
-    db.commit()
+def _record_progress(
+    job: Job, last_progress: Dict[str, Any], stage_name: str, stage_index: int, progress: float
+):
+    """
+    Publish live stage progress; the job row is only updated without Redis.
+
+    ``last_progress`` keeps the latest stage so the failure path can still
+    record on the row where the job stopped.
+    """
+    last_progress.update(stage=stage_name, stage_index=stage_index, progress=progress)
+    if publish_progress(job.id, stage_name, stage_index, progress):
+        return
+    job.current_stage = stage_name
+    job.stage_index = stage_index
+    job.progress = progress
 
 
-def _load_checkpoint(db, job_id: str, stage_name: str):
-    """Load checkpoint if exists."""
-    checkpoint = db.query(AuditLog).filter(
-        AuditLog.job_id == job_id,
-        AuditLog.stage_name == f"checkpoint:{stage_name}"
-    ).first()
+def _save_checkpoint(
+    db, checkpoints: Dict[str, Any], job_id: str, stage_name: str, data: dict, autocommit: bool = False
+):
+    """
+    Save checkpoint for resumability.
 
-    return checkpoint.metrics if checkpoint else None
+    Upserts the (job, stage) row without committing; the pipeline commits once
+    per stage together with the audit entries (pass ``autocommit=True`` for a
+    standalone write). ``checkpoints`` is the map loaded by ``_load_checkpoints``
+    and is kept in sync so later stages skip the DB.
+    """
+    # With the object store backend the row only points at the compressed payload
+    stored = data
+    if settings.CHECKPOINT_STORE == "minio":
+        stored = {_CHECKPOINT_BLOB_KEY: _save_checkpoint_s3(job_id, stage_name, data)}
+
+    # One row per (job, stage): a re-run stage overwrites its previous state
+    now = datetime.now(timezone.utc)
+    insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is None:
+        checkpoint = db.query(Checkpoint).filter(
+            Checkpoint.job_id == job_id,
+            Checkpoint.stage_name == stage_name,
+        ).first()
+        if checkpoint is None:
+            db.add(Checkpoint(job_id=job_id, stage_name=stage_name, data=stored, created_at=now, updated_at=now))
+        else:
+            checkpoint.data = stored
+            checkpoint.updated_at = now
+    else:
+        stmt = insert(Checkpoint).values(
+            job_id=job_id, stage_name=stage_name, data=stored, created_at=now, updated_at=now
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["job_id", "stage_name"],
+            set_={"data": stmt.excluded.data, "updated_at": stmt.excluded.updated_at},
+        ))
+    checkpoints[stage_name] = data
+    if autocommit:
+        db.commit()
+
+
+def _load_checkpoints(db, job_id: str) -> Dict[str, Any]:
+    """Load all checkpoints for a job in a single query, keyed by stage name."""
+    rows = db.execute(_LOAD_CHECKPOINTS_STMT, {"job_id": job_id}).all()
+
+    checkpoints: Dict[str, Any] = {}
+    for stage_name, data in rows:
+        if isinstance(data, dict) and _CHECKPOINT_BLOB_KEY in data:
+            data = _load_checkpoint_s3(data[_CHECKPOINT_BLOB_KEY])
+        checkpoints[stage_name] = data
+    return checkpoints
+
+
+_CHECKPOINT_BLOB_KEY = "checkpoint_object"
+
+# Built once and cached by SQLAlchemy; executions only bind new parameters
+_LOAD_CHECKPOINTS_STMT = lambda_stmt(
+    lambda: select(Checkpoint.stage_name, Checkpoint.data).where(Checkpoint.job_id == bindparam("job_id"))
+)
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
 
 
-def _create_audit_log(db, job_id: str, stage_name: str, stage_index: int, status: str, metrics: dict = None):
-    """Create audit log entry."""
+def _save_checkpoint_s3(job_id: str, stage_name: str, data: dict) -> str:
+    """Upload a compressed checkpoint payload; returns its object name."""
+    # Same encoding as the JSON column, so either store accepts the same payloads
+    payload = _json_serializer(data).encode()
+    if ZSTD_AVAILABLE:
+        blob, suffix, content_type = zstandard.compress(payload, 3), "zst", "application/zstd"
+    else:
+        blob, suffix, content_type = gzip.compress(payload, 6), "gz", "application/gzip"
+
+    object_name = f"{get_job_storage_prefix(job_id)}checkpoints/{stage_name}.json.{suffix}"
+    get_storage_service().upload_bytes(blob, object_name, content_type=content_type)
+    return object_name
+
+
+def _load_checkpoint_s3(object_name: str) -> dict:
+    """Download and decode a checkpoint written by ``_save_checkpoint_s3``."""
+    blob = get_storage_service().download_bytes(object_name)
+    payload = zstandard.decompress(blob) if object_name.endswith(".zst") else gzip.decompress(blob)
+    return _json_deserializer(payload)
+
+
+def _create_audit_log(
+    db, job_id: str, stage_name: str, stage_index: int, status: str, metrics: dict = None, autocommit: bool = False
+):
+    """Create audit log entry (staged and committed with the stage unless ``autocommit``)."""
     audit = AuditLog(
         job_id=job_id,
         stage_name=stage_name,
@@ -441,13 +554,96 @@ def _create_audit_log(db, job_id: str, stage_name: str, stage_index: int, status
         created_at=datetime.now(timezone.utc)
     )
     db.add(audit)
-    db.commit()
+    if autocommit:
+        db.commit()
 
 
 # ============================================================================
 # Periodic Tasks
 # ============================================================================
 
+def _delete_job_folder(storage, job_id: str) -> bool:
+    """Delete a job's stored files; returns False (after logging) on failure."""
+    try:
+        storage.delete_folder(get_job_storage_prefix(job_id))
+        return True
+    except Exception as e:
+        logger.error(f"Failed to delete job {job_id}: {e}")
+        return False
+
+
+def _load_cleanup_cursor(db) -> str:
+    """Last job ID covered by an unfinished cleanup run ("" when none)."""
+    value = db.execute(
+        select(SystemConfig.value).where(SystemConfig.key == _CLEANUP_CURSOR_KEY)
+    ).scalar()
+    return json.loads(value)["cursor_id"] if value else ""
+
+
+def _save_cleanup_cursor(db, cursor_id: Optional[str]):
+    """Stage the cleanup cursor (None clears it); committed with the batch."""
+    config = db.get(SystemConfig, _CLEANUP_CURSOR_KEY)
+    if cursor_id is None:
+        if config is not None:
+            db.delete(config)
+        return
+
+    value = json.dumps({"cursor_id": cursor_id, "ts": datetime.now(timezone.utc).isoformat()})
+    if config is None:
+        db.add(SystemConfig(
+            key=_CLEANUP_CURSOR_KEY,
+            value=value,
+            value_type="json",
+            category="maintenance",
+            description="Resume point of an interrupted cleanup_expired_jobs run",
+        ))
+    else:
+        config.value = value
+
+
+def _iter_expired_job_batches(db, now: datetime, after_id: str = ""):
+    """
+    Yield expired job IDs in order, CLEANUP_BATCH_SIZE at a time.
+
+    One query streamed through a server-side cursor on its own connection, so
+    the per-batch commits on ``db`` do not close it and only one batch of IDs
+    is held in memory.
+    """
+    expired_ids = select(Job.id).where(
+        Job.expires_at <= now,
+        Job.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
+        Job.id > after_id,
+    ).order_by(Job.id)
+
+    with db.get_bind().connect() as reader:
+        result = reader.execution_options(stream_results=True, yield_per=CLEANUP_BATCH_SIZE).execute(expired_ids)
+        for partition in result.scalars().partitions():
+            yield list(partition)
+
+
+def _delete_job_rows(db, ids):
+    """
+    Delete jobs and all their child rows with plain server-side DELETEs.
+
+    On PostgreSQL the child deletes ride along as data-modifying CTEs, so the
+    whole batch is a single statement (foreign keys are checked at statement
+    end); other backends run child deletes first, then the jobs.
+    """
+    child_deletes = [model.__table__.delete().where(model.job_id.in_(ids)) for model in _JOB_CHILD_MODELS]
+    job_delete = delete(Job).where(Job.id.in_(ids))
+
+    if db.get_bind().dialect.name == "postgresql":
+        for model, stmt in zip(_JOB_CHILD_MODELS, child_deletes):
+            job_delete = job_delete.add_cte(stmt.cte(f"deleted_{model.__tablename__}"))
+        statements = [job_delete]
+    else:
+        statements = [*child_deletes, job_delete]
+
+    # Rows are never loaded, so there is no session state to reconcile
+    for stmt in statements:
+        db.execute(stmt.execution_options(synchronize_session=False))
+
+
 @celery_app.task(name="app.tasks.prediction_tasks.cleanup_expired_jobs")
 def cleanup_expired_jobs():
     """
@@ -457,43 +653,59 @@ def cleanup_expired_jobs():
     """
     db = SessionLocal()
     try:
-        # Find expired jobs
-        expired_jobs = db.query(Job).filter(
-            Job.expires_at <= datetime.now(timezone.utc),
-            Job.status.in_([JobStatus.COMPLETED, JobStatus.FAILED])
-        ).all()
-
-        logger.info(f"Found {len(expired_jobs)} expired jobs to cleanup")
+        now = datetime.now(timezone.utc)
+        deleted_count = 0
+
+        # Nothing expired is the common case: one index seek on
+        # (status, expires_at) and no other statement
+        has_expired = db.execute(
+            select(1).where(
+                Job.expires_at <= now,
+                Job.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
+            ).limit(1)
+        ).first()
+        if not has_expired:
+            return {"deleted_count": 0, "status": "success"}
 
         storage = get_storage_service()
 
-        for job in expired_jobs:
-            try:
-                # Delete files from storage
-                prefix = f"jobs/{job.id}/"
-                storage.delete_folder(prefix)
-
-                # Delete file records
-                db.query(FileStorage).filter(FileStorage.job_id == job.id).delete()
-
-                # Delete audit logs
-                db.query(AuditLog).filter(AuditLog.job_id == job.id).delete()
-
-                # Delete result
-                db.query(Result).filter(Result.job_id == job.id).delete()
+        # Resume after the last batch an interrupted run got through
+        last_id = _load_cleanup_cursor(db)
+        if last_id:
+            logger.info(f"Resuming expired-job cleanup after {last_id}")
 
-                # Delete job
-                db.delete(job)
+        # Stream expired job IDs in batches so memory and transaction length
+        # stay bounded however large the backlog is
+        for batch_ids in _iter_expired_job_batches(db, now, after_id=last_id):
+            last_id = batch_ids[-1]
 
-                logger.info(f"Deleted expired job: {job.id}")
+            # Delete files from storage first, concurrently (each is a remote
+            # round trip); jobs whose files could not be removed keep their
+            # rows and are retried on the next run
+            folders_deleted = _CLEANUP_EXECUTOR.map(lambda job_id: _delete_job_folder(storage, job_id), batch_ids)
+            ids = [job_id for job_id, ok in zip(batch_ids, folders_deleted) if ok]
 
+            try:
+                # The cursor commits atomically with the batch it covers
+                if ids:
+                    _delete_job_rows(db, ids)
+                _save_cleanup_cursor(db, last_id)
+                db.commit()
             except Exception as e:
-                logger.error(f"Failed to delete job {job.id}: {e}")
+                db.rollback()
+                logger.error(f"Failed to delete expired job batch ending at {last_id}: {e}")
+                continue
+
+            deleted_count += len(ids)
+            logger.info(f"Deleted {len(ids)} expired jobs (batch ending at {last_id})")
 
+        # Completed a full pass: the next run starts from the beginning again,
+        # picking up newly expired jobs and ones whose files failed to delete
+        _save_cleanup_cursor(db, None)
         db.commit()
 
         return {
-            "deleted_count": len(expired_jobs),
+            "deleted_count": deleted_count,
             "status": "success"
         }
 
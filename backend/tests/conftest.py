@@ -31,3 +31,13 @@ os.environ.setdefault("MINIO_ENDPOINT", "")
 def _init_db():
     """Create SQLite tables for API/core tests."""
     init_db()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and app lifespan) shared across the whole test session."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,17 +1,12 @@
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from fastapi.testclient import TestClient
 from jose import jwt
 
-from app.main import app
 from app.core.settings import settings
 
 
-client = TestClient(app)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def token():
     payload = {
         "sub": "user-1",
@@ -19,7 +14,7 @@ def token():
         "roles": ["admin"],
         "perms": ["predict:create", "predict:read"],
         "aud": settings.JWT_AUD,
-        "exp": datetime.now(timezone.utc) + timedelta(minutes=30),
+        "exp": datetime.now(timezone.utc) + timedelta(hours=24),
     }
     return jwt.encode(
         payload,
@@ -29,7 +24,7 @@ def token():
     )
 
 
-def test_predict_success(token, monkeypatch):
+def test_predict_success(client, token, monkeypatch):
     class _DummyTask:
         def delay(self, **kwargs):
             return None
@@ -51,7 +46,7 @@ def test_predict_success(token, monkeypatch):
     assert data["job_id"].startswith("exp-")
 
 
-def test_predict_invalid_sequence(token):
+def test_predict_invalid_sequence(client, token):
     resp = client.post(
         "/api/v1/predict",
         headers={"Authorization": f"Bearer {token}"},
@@ -60,7 +55,7 @@ def test_predict_invalid_sequence(token):
     assert resp.status_code == 422
 
 
-def test_predict_unauthorized():
+def test_predict_unauthorized(client):
     resp = client.post(
         "/api/v1/predict",
         json={"sequence": "ACDEFGHIKLMNPQRSTVWY", "experiment_type": "protein_folding", "method": "alphafold3"},
@@ -68,7 +63,7 @@ def test_predict_unauthorized():
     assert resp.status_code == 401
 
 
-def test_status_not_found(token):
+def test_status_not_found(client, token):
     resp = client.get(
         "/api/v1/jobs/exp-missing/status",
         headers={"Authorization": f"Bearer {token}"},
@@ -76,7 +71,7 @@ def test_status_not_found(token):
     assert resp.status_code == 404
 
 
-def test_result_not_found(token):
+def test_result_not_found(client, token):
     resp = client.get(
         "/api/v1/jobs/exp-missing/result",
         headers={"Authorization": f"Bearer {token}"},
@@ -84,7 +79,7 @@ def test_result_not_found(token):
     assert resp.status_code == 404
 
 
-def test_auth_invalid_token():
+def test_auth_invalid_token(client):
     resp = client.post(
         "/api/v1/predict",
         headers={"Authorization": "Bearer invalid"},
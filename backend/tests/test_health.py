@@ -1,12 +1,4 @@
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-
-client = TestClient(app)
-
-
-def test_health_endpoint_returns_status():
+def test_health_endpoint_returns_status(client):
     resp = client.get("/health")
     assert resp.status_code == 200
     body = resp.json()
@@ -14,7 +6,7 @@ def test_health_endpoint_returns_status():
     assert "services" in body
 
 
-def test_openapi_available():
+def test_openapi_available(client):
     resp = client.get("/openapi.json")
     assert resp.status_code == 200
     assert resp.json().get("info", {}).get("title") == "RExSyn Nexus API"
@@ -1,13 +1,11 @@
+from datetime import timedelta
+
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import app
 from app.services import auth_service
 
-client = TestClient(app)
-
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_token():
     payload = {
         "user_id": "test-user-1",
@@ -16,10 +14,10 @@ def auth_token():
         "role": "admin",
         "org_id": "org-test",
     }
-    return auth_service.create_access_token(payload)
+    return auth_service.create_access_token(payload, expires_delta=timedelta(hours=24))
 
 
-def test_full_prediction_workflow_placeholder(auth_token):
+def test_full_prediction_workflow_placeholder(client, auth_token):
     headers = {"Authorization": f"Bearer {auth_token}"}
 
     # Submit prediction
@@ -53,7 +51,7 @@ def test_full_prediction_workflow_placeholder(auth_token):
     assert result_data["status"] in ["queued", "completed"]
 
 
-def test_predict_without_auth_fails():
+def test_predict_without_auth_fails(client):
     resp = client.post(
         "/api/v1/predict",
         json={"sequence": "ACDEFGHIKLMNPQRSTVWY", "experiment_type": "protein_folding", "method": "alphafold3"},
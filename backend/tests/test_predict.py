@@ -1,12 +1,7 @@
-from fastapi.testclient import TestClient
-
 from app.main import app
 from app.core import settings
 
 
-client = TestClient(app)
-
-
 def test_placeholder_pipeline_default():
     assert settings.settings.SCIENCE_MODE == "placeholder"
 
@@ -15,7 +10,7 @@ def test_db_url_uses_sqlite_by_default():
     assert settings.settings.DB_URL.startswith("sqlite:///")
 
 
-def test_health_returns_status_and_services():
+def test_health_returns_status_and_services(client):
     resp = client.get("/health")
     assert resp.status_code == 200
     body = resp.json()
@@ -24,13 +19,13 @@ def test_health_returns_status_and_services():
     assert set(body["services"].keys()) >= {"database", "redis", "minio"}
 
 
-def test_ui_redirect_present():
+def test_ui_redirect_present(client):
     resp = client.get("/ui", follow_redirects=False)
     assert resp.status_code in (302, 307)
     assert "/frontend/landing/home/code.html" in resp.headers.get("location", "")
 
 
-def test_predict_rejects_too_long_sequence():
+def test_predict_rejects_too_long_sequence(client):
     long_seq = "A" * 10001  # over max_length
     resp = client.post(
         "/api/v1/predict",
@@ -44,7 +39,7 @@ def test_predict_rejects_too_long_sequence():
     assert resp.status_code in (401, 422)
 
 
-def test_root_contains_links():
+def test_root_contains_links(client):
     resp = client.get("/")
     assert resp.status_code == 200
     body = resp.json()
@@ -56,17 +51,17 @@ def test_rate_limit_enabled_on_app_state():
     assert hasattr(app.state, "limiter")
 
 
-def test_docs_available():
+def test_docs_available(client):
     resp = client.get("/docs")
     assert resp.status_code == 200
 
 
-def test_redoc_available():
+def test_redoc_available(client):
     resp = client.get("/redoc")
     assert resp.status_code == 200
 
 
-def test_openapi_available():
+def test_openapi_available(client):
     resp = client.get("/openapi.json")
     assert resp.status_code == 200
     assert resp.json().get("info", {}).get("title") == "RExSyn Nexus API"
@@ -0,0 +1,53 @@
+from app.services import progress_service
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def execute(self):
+        return []
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+def test_progress_round_trips_through_redis(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(progress_service, "_get_redis", lambda: fake)
+
+    assert progress_service.read_progress("exp-1") is None
+    assert progress_service.publish_progress("exp-1", "Policy Check", 4, 0.64)
+    assert progress_service.read_progress("exp-1") == {"stage": "Policy Check", "stage_index": 4, "progress": 0.64}
+    assert fake.ttls["job:exp-1:progress"] == progress_service.PROGRESS_TTL_SECONDS
+
+
+def test_progress_disabled_falls_back_to_database():
+    assert progress_service.publish_progress("exp-1", "Policy Check", 4, 0.64) is False
+    assert progress_service.read_progress("exp-1") is None
+
+
+def test_job_progress_prefers_live_entry_for_running_jobs(monkeypatch):
+    from types import SimpleNamespace
+
+    from app.db.models import JobStatus
+
+    fake = _FakeRedis()
+    monkeypatch.setattr(progress_service, "_get_redis", lambda: fake)
+    progress_service.publish_progress("exp-1", "Policy Check", 4, 0.64)
+
+    job = SimpleNamespace(id="exp-1", status=JobStatus.RUNNING, current_stage=None, stage_index=0, progress=0.0)
+    assert progress_service.job_progress(job) == {"stage": "Policy Check", "stage_index": 4, "progress": 0.64}
+
+    job.status, job.current_stage, job.stage_index, job.progress = JobStatus.FAILED, "MD Refinement", 5, 0.76
+    assert progress_service.job_progress(job) == {"stage": "MD Refinement", "stage_index": 5, "progress": 0.76}
@@ -0,0 +1,150 @@
+import hashlib
+import io
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.services.reproducibility_service import (
+    IncrementalAuditHash,
+    ReproducibilityReport,
+    ReproducibilityService,
+)
+
+
+def _job(**overrides):
+    job = SimpleNamespace(
+        id="exp-repro-1",
+        experiment_type="protein_folding",
+        method="alphafold3",
+        sequence="ACDEFGHIKLMNPQRSTVWY" * 4,
+        prediction_config={"confidence_threshold": 0.7, "enable_md_refinement": True},
+        ethics_config={"ove_threshold": 0.85},
+        processing_time_seconds=245,
+        created_at=datetime(2025, 1, 1),
+        started_at=datetime(2025, 1, 1, 0, 1),
+        completed_at=None,
+    )
+    for key, value in overrides.items():
+        setattr(job, key, value)
+    return job
+
+
+def _result():
+    return SimpleNamespace(
+        quality_grade="A",
+        confidence=0.92,
+        pdb_file_path="/tmp/exp-repro-1_predicted.pdb",
+        report_pdf_path=None,
+        plddt_score=87.5,
+        saxs_chi2=1.85,
+        dockq_score=0.78,
+        ove_score=0.91,
+    )
+
+
+def test_markdown_export_contains_sections():
+    svc = ReproducibilityService()
+    report = svc.generate_report(_job(), _result())
+    md = svc.export_to_markdown(report)
+    assert md.startswith("# Reproducibility Report")
+    assert "**Job ID**: exp-repro-1" in md
+    assert '"confidence_threshold": 0.7' in md
+    assert "numpy==1.26.4" in md
+    assert "- Job created" in md
+    assert "earlier entries omitted" not in md
+    assert f"- Job completed successfully\n\n**Audit Hash**: `{report.incremental_audit_hash[:16]}...` (5 events)" in md
+
+
+def test_markdown_export_truncates_audit_trail():
+    svc = ReproducibilityService()
+    report = svc.generate_report(_job(), _result())
+    report.audit_trail = [f"event {i}" for i in range(15)]
+    md = svc.export_to_markdown(report)
+    assert "... 5 earlier entries omitted\n- event 5\n" in md
+    assert "- event 4\n" not in md
+    assert "- event 14" in md
+
+
+def test_methods_section_skips_unused_sections(monkeypatch):
+    svc = ReproducibilityService()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("audit trail should not be computed")
+
+    monkeypatch.setattr(svc, "_get_audit_trail", _fail)
+    report = svc.generate_report(_job(), _result())
+    methods = svc.export_methods_section(report)
+    assert "AlphaFold 3" in methods
+    assert "audit_trail" not in report.__dict__
+
+
+def test_json_export_materializes_lazy_report():
+    svc = ReproducibilityService()
+    report = svc.generate_report(_job(), _result(), include_audit_trail=False)
+    data = json.loads(svc.export_to_json(report))
+    assert data["job_id"] == "exp-repro-1"
+    assert data["audit_trail"] == []
+    assert data["software"]["dependencies"]["numpy"] == "1.26.4"
+    assert data["quality_metrics"]["plddt_score"] == 87.5
+
+
+def test_write_markdown_streams_same_document():
+    svc = ReproducibilityService()
+    report = svc.generate_report(_job(), _result(), include_audit_trail=False)
+    buffer = io.StringIO()
+    svc.write_markdown(report, buffer)
+    assert buffer.getvalue() == svc.export_to_markdown(report)
+    assert "## Audit Trail\n\n\n\n\n---" in buffer.getvalue()
+
+
+def test_methods_section_handles_missing_sections():
+    svc = ReproducibilityService()
+    report = ReproducibilityReport(job_id="exp-bare", method="esmfold", model_version="1.0.3")
+    methods = svc.export_methods_section(report)
+    assert "ESMFold (version 1.0.3)" in methods
+    assert "confidence threshold = default, without molecular dynamics" in methods
+    assert "executed on GPU hardware with N/A GPU(s)" in methods
+    assert "moderate confidence" in methods
+
+
+def test_model_checksum_hashes_weights_file(tmp_path, monkeypatch):
+    from app.core.settings import settings
+
+    weights = tmp_path / "esmfold_3B_v1.pt"
+    weights.write_bytes(b"\x00\x01weights" * 200_000)
+    monkeypatch.setattr(settings, "MODEL_WEIGHTS_DIR", str(tmp_path))
+
+    checksum = ReproducibilityService()._get_model_checksum("esmfold")
+    assert checksum == "sha256:" + hashlib.sha256(weights.read_bytes()).hexdigest()
+
+    job = _job(method="esmfold")
+    report = ReproducibilityService().generate_report(job, _result())
+    assert report.model_checksum == checksum
+    assert report.sequence_checksum == hashlib.sha256(job.sequence.encode()).hexdigest()
+
+
+def test_audit_trail_keeps_tail_and_incremental_hash(monkeypatch):
+    svc = ReproducibilityService()
+    events = [f"stage {i} completed" for i in range(25)]
+    monkeypatch.setattr(svc, "_get_audit_trail", lambda job: iter(events))
+    report = svc.generate_report(_job(), _result())
+
+    assert report.audit_trail == events[-10:]
+    assert report.audit_event_count == 25
+
+    verifier = IncrementalAuditHash()
+    for event in reversed(events):
+        verifier.update(event)
+    assert report.incremental_audit_hash == verifier.hexdigest()
+
+    resumed = IncrementalAuditHash(report.incremental_audit_hash)
+    resumed.update("extra event")
+    assert resumed.hexdigest() != report.incremental_audit_hash
+
+
+def test_parameters_json_serialized_once():
+    svc = ReproducibilityService()
+    report = svc.generate_report(_job(), _result())
+    assert report.parameters_json is report.parameters_json
+    assert json.loads(report.ethics_json) == {"ove_threshold": 0.85}
+    assert report.parameters_json in svc.export_to_markdown(report)
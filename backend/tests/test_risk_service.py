@@ -0,0 +1,46 @@
+import math
+
+from app.services.risk_service import Calibrator, RiskModel, RiskParams
+
+
+def test_calibrator_matches_closed_form():
+    rows = [(5.0, 2.0, 1.0), (1.0, 1.0, 0.0), (12.0, 0.5, 0.3)]
+    params = Calibrator().fit(rows)
+
+    xs = [(1.0 / max(dr, 1e-3), dsc) for dr, dsc, _ in rows]
+    w1 = sum(inc * a for (a, _), (_, _, inc) in zip(xs, rows)) / (sum(a * a for a, _ in xs) + 1e-3)
+    w2 = sum(inc * b for (_, b), (_, _, inc) in zip(xs, rows)) / (sum(b * b for _, b in xs) + 1e-3)
+    assert math.isclose(params.lambda0, min(0.25, max(0.03, abs(w1))))
+    assert math.isclose(params.alpha, max(0.1, min(3.0, abs(w2) / max(w1, 1e-6))))
+
+
+def test_calibrator_handles_empty_and_malformed_rows():
+    empty = Calibrator().fit([])
+    assert (empty.lambda0, empty.alpha) == (0.03, 0.1)
+
+    fallback = Calibrator().fit([(1.0, 2.0)])
+    assert fallback == RiskParams()
+
+    assert Calibrator().fit([(1, 2), (3, 4), (5, 6)]) == RiskParams()
+
+
+def test_effective_risk_decays_with_time():
+    model = RiskModel()
+    assert model.effective_risk(0.8, 0, 10.0) == 0.8
+    assert math.isclose(model.effective_risk(0.8, 7, 10.0), 0.8 * math.exp(-0.1 * 7))
+
+
+def test_effective_risk_batch_matches_scalar():
+    model = RiskModel(RiskParams(lambda0=0.12, alpha=1.5))
+    base = [0.8, 0.5, 0.9, 0.1]
+    days = [0.0, 3.0, 10.0, 45.0]
+    deploy = [0.0, 2.0, 10.0, 200.0]
+    batch = model.effective_risk_batch(base, days, deploy)
+    for got, args in zip(batch, zip(base, days, deploy)):
+        assert math.isclose(got, model.effective_risk(*args), rel_tol=1e-12)
+
+
+def test_lambda_t_batch_matches_scalar_clamp():
+    model = RiskModel()
+    rates = [0.0, 1.0, 4.0, 10.0, 40.0, 1000.0]
+    assert list(model.lambda_t_batch(rates)) == [model.lambda_t(rate) for rate in rates]
@@ -0,0 +1,54 @@
+from app.services.science_service import ScienceService
+
+
+def _external_service(tmp_path, monkeypatch, calls):
+    svc = ScienceService(mode="external", cache_dir=str(tmp_path / "cache"))
+    svc.posebusters_cmd = "posebusters"
+    svc.dockq_cmd = "dockq"
+    svc.saxs_cmd = ""
+
+    def _fake_exec(cmd, args):
+        calls.append(cmd)
+        return {"pass_ratio": 0.9} if cmd == "posebusters" else {"dockq": 0.65}
+
+    monkeypatch.setattr(svc, "_exec_json", _fake_exec)
+    return svc
+
+
+def test_external_results_cached_by_file_content(tmp_path, monkeypatch):
+    pdb = tmp_path / "model.pdb"
+    pdb.write_text("ATOM      1  N   ALA A   1\n")
+    calls = []
+    svc = _external_service(tmp_path, monkeypatch, calls)
+
+    first = svc.evaluate_structure(str(pdb), saxs_enabled=False)
+    second = svc.evaluate_structure(str(pdb), saxs_enabled=False)
+
+    assert first == second
+    assert first["dockq_score"] == 0.65
+    assert first["posebusters_pass_ratio"] == 0.9
+    assert sorted(calls) == ["dockq", "posebusters"]
+
+    pdb.write_text("ATOM      1  N   GLY A   1\n")
+    svc.evaluate_structure(str(pdb), saxs_enabled=False)
+    assert len(calls) == 4
+
+
+def test_placeholder_mode_returns_defaults():
+    svc = ScienceService(mode="placeholder")
+    out = svc.evaluate_structure("/tmp/missing.pdb", saxs_enabled=False)
+    assert out == {"dockq_score": 0.78, "saxs_chi2": None, "posebusters_pass_ratio": 0.87}
+
+
+def test_external_runs_all_configured_calculators(monkeypatch):
+    svc = ScienceService(mode="external")
+    svc.posebusters_cmd, svc.dockq_cmd, svc.saxs_cmd = "posebusters", "dockq", "saxs"
+    outputs = {
+        "posebusters": {"pass_rate": 0.8},
+        "dockq": {"dockq_score": 0.5},
+        "saxs": {"reduced_chi2": 2.5},
+    }
+    monkeypatch.setattr(svc, "_exec_json", lambda cmd, args: outputs[cmd])
+
+    out = svc.evaluate_structure("/tmp/any.pdb", saxs_enabled=True)
+    assert out == {"posebusters_pass_ratio": 0.8, "dockq_score": 0.5, "saxs_chi2": 2.5}
@@ -29,9 +29,7 @@ def test_metrics_router_mounted():
     assert "/metrics" in routes
 
 
-def test_health_services_keys_present():
-    from fastapi.testclient import TestClient
-    client = TestClient(app)
+def test_health_services_keys_present(client):
     resp = client.get("/health")
     body = resp.json()
     assert "services" in body
@@ -0,0 +1,146 @@
+import hashlib
+import mimetypes
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.storage_service import StorageService, _part_size_for, sha256_file
+
+
+class _FakeMinio:
+    def __init__(self, etag):
+        self.etag = etag
+        self.calls = []
+
+    def fput_object(self, bucket, object_name, file_path, **kwargs):
+        self.calls.append(("fput_object", object_name, kwargs))
+        return SimpleNamespace(etag=self.etag)
+
+    def put_object(self, bucket, object_name, data, length, **kwargs):
+        self.calls.append(("put_object", object_name, kwargs))
+        return SimpleNamespace(etag=self.etag)
+
+
+def _service(etag):
+    svc = StorageService.__new__(StorageService)
+    svc.bucket_name = "rexsyn-test"
+    svc.client = _FakeMinio(etag)
+    return svc
+
+
+def test_sha256_matches_hashlib(tmp_path):
+    path = tmp_path / "structure.pdb"
+    data = b"ATOM      1  N   ALA A   1\n" * 50_000
+    path.write_bytes(data)
+
+    assert sha256_file(path) == hashlib.sha256(data).hexdigest()
+
+    empty = tmp_path / "empty.pdb"
+    empty.write_bytes(b"")
+    assert sha256_file(empty) == hashlib.sha256(b"").hexdigest()
+
+
+def test_upload_file_takes_md5_from_etag(tmp_path):
+    path = tmp_path / "structure.pdb"
+    data = b"ATOM      1  N   ALA A   1\n"
+    path.write_bytes(data)
+    md5_hash = hashlib.md5(data).hexdigest()
+    svc = _service(f'"{md5_hash}"')
+
+    info = svc.upload_file(str(path), "jobs/exp-1/pdb/structure.pdb")
+
+    assert info["md5_hash"] == md5_hash
+    assert info["sha256_hash"] == hashlib.sha256(data).hexdigest()
+    metadata = svc.client.calls[0][2]["metadata"]
+    assert "md5" not in metadata
+    assert metadata["sha256"] == info["sha256_hash"]
+    assert datetime.fromisoformat(metadata["uploaded_at"]).tzinfo == timezone.utc
+    assert svc.client.calls[0][2]["part_size"] == 5 * 1024 * 1024
+    assert info["content_type"] == (mimetypes.guess_type(str(path))[0] or "application/octet-stream")
+
+
+def test_upload_file_detects_multi_suffix_content_type(tmp_path):
+    svc = _service('"etag"')
+    for name in ("metrics.json.gz", "bundle.tar.gz"):
+        path = tmp_path / name
+        path.write_bytes(b"\x1f\x8b")
+        info = svc.upload_file(str(path), f"jobs/exp-1/{name}")
+        assert info["content_type"] == mimetypes.guess_type(str(path))[0]
+    assert svc.client.calls[0][2]["content_type"] == "application/json"
+
+
+def test_upload_bytes_multipart_etag_has_no_md5():
+    svc = _service("0123456789abcdef0123456789abcdef-3")
+    info = svc.upload_bytes(b"report", "jobs/exp-1/pdf/report.pdf")
+    assert info["md5_hash"] is None
+    assert info["sha256_hash"] == hashlib.sha256(b"report").hexdigest()
+
+
+def test_delete_folder_batches_removals(monkeypatch):
+    monkeypatch.setattr("app.services.storage_service.DeleteObject", lambda name: name, raising=False)
+    svc = _service(None)
+    removed = []
+
+    def _list_objects(bucket, prefix, recursive):
+        return iter(SimpleNamespace(object_name=f"{prefix}file-{i}") for i in range(3))
+
+    def _remove_objects(bucket, delete_list):
+        removed.append(list(delete_list))
+        return iter(())
+
+    svc.client.list_objects = _list_objects
+    svc.client.remove_objects = _remove_objects
+
+    svc.delete_folder("jobs/exp-1/")
+    assert removed == [["jobs/exp-1/file-0", "jobs/exp-1/file-1", "jobs/exp-1/file-2"]]
+
+
+def test_part_size_scales_with_file_size():
+    mib = 1024 * 1024
+    assert _part_size_for(10 * mib) == 5 * mib
+    assert _part_size_for(500 * mib) == 16 * mib
+    assert _part_size_for(4096 * mib) == 64 * mib
+
+
+def test_upload_job_files_fans_out_in_order(tmp_path, monkeypatch):
+    from app.services import storage_service
+
+    svc = _service('"0123456789abcdef0123456789abcdef"')
+    monkeypatch.setattr(storage_service, "_storage_service", svc)
+    paths = []
+    for name in ("model.pdb", "refined.pdb", "report.pdf"):
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        paths.append(path)
+
+    infos = storage_service.upload_job_files(
+        "exp-1", [(str(paths[0]), "pdb"), (str(paths[1]), "pdb"), (str(paths[2]), "pdf")]
+    )
+
+    assert [info["object_name"] for info in infos] == [
+        "jobs/exp-1/pdb/model.pdb",
+        "jobs/exp-1/pdb/refined.pdb",
+        "jobs/exp-1/pdf/report.pdf",
+    ]
+    assert len(svc.client.calls) == 3
+
+
+def test_batch_sha256_files(tmp_path):
+    from app.services.storage_service import batch_sha256_files
+
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"frame_{i}.pdb"
+        path.write_bytes(b"MODEL %d\n" % i * 1000)
+        paths.append(path)
+
+    digests = batch_sha256_files(str(path) for path in paths)
+    assert digests == {path: hashlib.sha256(path.read_bytes()).hexdigest() for path in paths}
+
+
+def test_upload_file_missing_path_raises(tmp_path):
+    svc = _service('"0123456789abcdef0123456789abcdef"')
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        svc.upload_file(str(tmp_path / "missing.pdb"), "jobs/exp-1/pdb/missing.pdb")
+    assert svc.client.calls == []